@@ -5,12 +5,21 @@ import importlib.metadata
 
 from benchcab.utils import get_logger
 
-try:
-    __version__ = importlib.metadata.version("benchcab")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = ""
-    get_logger().warn(
-        "unable to interrogate version string from installed distribution."
-    )
-    # Note: cannot re-raise exception here as this will break pytest
-    # when running without first installing the package
+
+def __getattr__(name: str):
+    """Lazily resolve `__version__` from the installed distribution (PEP 562)."""
+    if name != "__version__":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    global __version__  # noqa: PLW0603
+    try:
+        __version__ = importlib.metadata.version("benchcab")
+    except importlib.metadata.PackageNotFoundError:
+        __version__ = ""
+        get_logger().warn(
+            "unable to interrogate version string from installed distribution."
+        )
+        # Note: cannot re-raise exception here as this will break pytest
+        # when running without first installing the package
+    return __version__
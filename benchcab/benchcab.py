@@ -3,6 +3,7 @@
 
 """Contains the benchcab application class."""
 
+import functools
 import grp
 import os
 import sys
@@ -28,6 +29,15 @@ from benchcab.workdir import (
     setup_spatial_directory_tree,
 )
 
+# Groups required to run benchcab (in addition to the user's project)
+_STATIC_REQUIRED_GROUPS = frozenset(("ks32", "hh5"))
+
+
+@functools.lru_cache(maxsize=1)
+def _current_group_names() -> frozenset[str]:
+    """Return the names of the groups the current user belongs to."""
+    return frozenset(grp.getgrgid(gid).gr_name for gid in os.getgroups())
+
 
 class Benchcab:
     """A class that represents the `benchcab` application."""
@@ -57,6 +67,7 @@ class Benchcab:
         self._models: list[Model] = []
         self._fluxsite_tasks: list[fluxsite.FluxsiteTask] = []
         self._spatial_tasks: list[spatial.SpatialTask] = []
+        self._validated_environments: set[tuple[str, tuple[str, ...]]] = set()
 
         # Get the logger object
         self.logger = get_logger()
@@ -65,14 +76,23 @@ class Benchcab:
     def _set_environment(self):
         """Sets environment variables on current user environment."""
         # Prioritize system binaries over externally set $PATHs (#220)
-        os.environ["PATH"] = f"{':'.join(internal.SYSTEM_PATHS)}:{os.environ['PATH']}"
+        paths = os.environ["PATH"].split(os.pathsep)
+        if paths[: len(internal.SYSTEM_PATHS)] == internal.SYSTEM_PATHS:
+            return
+        os.environ["PATH"] = os.pathsep.join([*internal.SYSTEM_PATHS, *paths])
 
     def _validate_environment(self, project: str, modules: list):
         """Performs checks on current user environment."""
         if not self.validate_env:
             return
 
-        if "gadi.nci" not in internal.NODENAME:
+        # Endpoints such as `fluxsite` call several other endpoints which each
+        # validate the environment, only do this once per project and modules.
+        key = (project, tuple(modules))
+        if key in self._validated_environments:
+            return
+
+        if "gadi.nci" not in internal.get_nodename():
             self.logger.error("benchcab is currently implemented only on Gadi")
             sys.exit(1)
 
@@ -89,9 +109,8 @@ class Benchcab:
                 """
             raise AttributeError(msg)
 
-        required_groups = set([project, "ks32", "hh5"])
-        groups = [grp.getgrgid(gid).gr_name for gid in os.getgroups()]
-        if not required_groups.issubset(groups):
+        required_groups = _STATIC_REQUIRED_GROUPS | {project}
+        if not required_groups <= _current_group_names():
             msg = (
                 f"""Error: user does not have the required group permissions.,
                 The required groups are:,
@@ -117,7 +136,7 @@ class Benchcab:
             + internal.MEORG_EXPERIMENTS["forty-two-site-test"]
         )
         for site_id in all_site_ids:
-            paths = list(internal.MET_DIR.glob(f"{site_id}*"))
+            paths = internal.get_met_file_names(site_id)
             if not paths:
                 self.logger.error(
                     f"Failed to infer met file for site id '{site_id}' in "
@@ -131,6 +150,8 @@ class Benchcab:
                 )
                 sys.exit(1)
 
+        self._validated_environments.add(key)
+
     def _get_config(self, config_path: str) -> dict:
         if not self._config:
             self._config = read_config(config_path)
@@ -4,13 +4,16 @@
 """Contains the definition of the command line interface used for `benchcab`."""
 
 import argparse
+from typing import TYPE_CHECKING
 
 import benchcab
-from benchcab.benchcab import Benchcab
 from benchcab.internal import OPTIONAL_COMMANDS
 
+if TYPE_CHECKING:
+    from benchcab.benchcab import Benchcab
 
-def generate_parser(app: Benchcab) -> argparse.ArgumentParser:
+
+def generate_parser(app: "Benchcab") -> argparse.ArgumentParser:
     """Returns the instance of `argparse.ArgumentParser` used for `benchcab`."""
     # parent parser that contains the help argument
     args_help = argparse.ArgumentParser(add_help=False)
@@ -4,7 +4,6 @@
 """A module containing functions and data structures for running comparison tasks."""
 
 import multiprocessing
-import operator
 import sys
 from pathlib import Path
 from subprocess import CalledProcessError
@@ -36,21 +35,19 @@ class ComparisonTask:
         """
         self.files = files
         self.task_name = task_name
-        self.logger = get_logger()
 
     def run(self) -> None:
         """Executes `nccmp -df` on the NetCDF files pointed to by `self.files`."""
+        logger = get_logger()
         file_a, file_b = self.files
-        self.logger.debug(f"Comparing files {file_a.name} and {file_b.name} bitwise...")
+        logger.debug(f"Comparing files {file_a.name} and {file_b.name} bitwise...")
 
         try:
             self.subprocess_handler.run_cmd(
                 f"nccmp -df {file_a} {file_b}",
                 capture_output=True,
             )
-            self.logger.info(
-                f"Success: files {file_a.name} {file_b.name} are identical"
-            )
+            logger.info(f"Success: files {file_a.name} {file_b.name} are identical")
         except CalledProcessError as exc:
             output_file = (
                 internal.FLUXSITE_DIRS["BITWISE_CMP"] / f"{self.task_name}.txt"
@@ -58,12 +55,17 @@ class ComparisonTask:
             with output_file.open("w", encoding="utf-8") as file:
                 file.write(exc.stdout)
 
-            self.logger.error(f"Failure: files {file_a.name} {file_b.name} differ. ")
-            self.logger.error(f"Results of diff have been written to {output_file}")
+            logger.error(f"Failure: files {file_a.name} {file_b.name} differ. ")
+            logger.error(f"Results of diff have been written to {output_file}")
 
         sys.stdout.flush()
 
 
+def _run_comparison(task: ComparisonTask) -> None:
+    """Runs a single comparison task in a worker process."""
+    task.run()
+
+
 def run_comparisons(comparison_tasks: list[ComparisonTask]) -> None:
     """Runs bitwise comparison tasks serially."""
     for task in comparison_tasks:
@@ -74,7 +76,19 @@ def run_comparisons_in_parallel(
     comparison_tasks: list[ComparisonTask],
     n_processes=internal.FLUXSITE_DEFAULT_PBS["ncpus"],
 ) -> None:
-    """Runs bitwise comparison tasks in parallel across multiple processes."""
-    run_task = operator.methodcaller("run")
+    """Runs bitwise comparison tasks in parallel across multiple processes.
+
+    The number of processes is capped at `internal.COMPARISON_MAX_PROCESSES` as
+    comparisons are I/O bound.
+    """
+    n_processes = min(n_processes, internal.COMPARISON_MAX_PROCESSES)
+    get_logger().debug(f"Running comparison tasks across {n_processes} processes")
+    # Note: hand out tasks in batches so that workers spend less time waiting
+    # on inter-process communication, while keeping enough batches per worker
+    # to balance the load
+    chunksize = max(1, len(comparison_tasks) // (n_processes * 4))
     with multiprocessing.Pool(n_processes) as pool:
-        pool.map(run_task, comparison_tasks, chunksize=1)
+        for _ in pool.imap_unordered(
+            _run_comparison, comparison_tasks, chunksize=chunksize
+        ):
+            pass
@@ -2,14 +2,37 @@
 # SPDX-License-Identifier: Apache-2.0
 
 """A module containing all *_config() functions."""
+import functools
+import hashlib
 import os
+import pickle
+import tempfile
 from pathlib import Path
+from typing import Optional
 
-import yaml
 from cerberus import Validator
 
+import benchcab
 import benchcab.utils as bu
 from benchcab import internal
+from benchcab.utils.dict import deep_setdefault
+
+# Default values for optional keys (other than `project`, realisation names
+# and spatial met forcings). Nested dictionaries are merged with user values.
+_OPTIONAL_KEY_DEFAULTS = {
+    "science_configurations": internal.DEFAULT_SCIENCE_CONFIGURATIONS,
+    "spatial": {
+        "payu": {"config": {}, "args": None},
+    },
+    "fluxsite": {
+        "multiprocess": internal.FLUXSITE_DEFAULT_MULTIPROCESS,
+        "experiment": internal.FLUXSITE_DEFAULT_EXPERIMENT,
+        "pbs": internal.FLUXSITE_DEFAULT_PBS,
+    },
+}
+
+# Validator for the config schema, constructed on first use.
+_VALIDATOR: Optional[Validator] = None
 
 
 class ConfigValidationError(Exception):
@@ -35,6 +58,18 @@ class ConfigValidationError(Exception):
         super().__init__(msg)
 
 
+def _get_validator() -> Validator:
+    """Return the config schema validator, creating it on first call."""
+    global _VALIDATOR  # noqa: PLW0603
+    if _VALIDATOR is None:
+        _VALIDATOR = Validator(
+            bu.load_package_data("config-schema.yml"),
+            allow_unknown=False,
+            purge_unknown=False,
+        )
+    return _VALIDATOR
+
+
 def validate_config(config: dict) -> bool:
     """Validate the configuration dictionary.
 
@@ -54,14 +89,12 @@ def validate_config(config: dict) -> bool:
         Raised when the configuration file fails validation.
 
     """
-    # Load the schema
-    schema = bu.load_package_data("config-schema.yml")
+    # Get the validator
+    v = _get_validator()
 
-    # Create a validator
-    v = Validator(schema)
-
-    # Validate
-    is_valid = v.validate(config)
+    # Validate. The schema defines no normalization rules (defaults, coercion,
+    # renaming) so the normalization pass can be skipped.
+    is_valid = v.validate(config, normalize=False)
 
     # Valid
     if is_valid:
@@ -92,32 +125,11 @@ def read_optional_key(config: dict):
         for r in config["realisations"]:
             r["name"] = r.get("name")
 
-    config["science_configurations"] = config.get(
-        "science_configurations", internal.DEFAULT_SCIENCE_CONFIGURATIONS
-    )
-
-    # Default values for spatial
-    config["spatial"] = config.get("spatial", {})
+    deep_setdefault(config, _OPTIONAL_KEY_DEFAULTS)
 
-    config["spatial"]["met_forcings"] = config["spatial"].get(
-        "met_forcings", internal.SPATIAL_DEFAULT_MET_FORCINGS
-    )
-
-    config["spatial"]["payu"] = config["spatial"].get("payu", {})
-    config["spatial"]["payu"]["config"] = config["spatial"]["payu"].get("config", {})
-    config["spatial"]["payu"]["args"] = config["spatial"]["payu"].get("args")
-
-    # Default values for fluxsite
-    config["fluxsite"] = config.get("fluxsite", {})
-
-    config["fluxsite"]["multiprocess"] = config["fluxsite"].get(
-        "multiprocess", internal.FLUXSITE_DEFAULT_MULTIPROCESS
-    )
-    config["fluxsite"]["experiment"] = config["fluxsite"].get(
-        "experiment", internal.FLUXSITE_DEFAULT_EXPERIMENT
-    )
-    config["fluxsite"]["pbs"] = internal.FLUXSITE_DEFAULT_PBS | config["fluxsite"].get(
-        "pbs", {}
+    # User specified met forcings replace the defaults rather than merging with them
+    config["spatial"].setdefault(
+        "met_forcings", dict(internal.SPATIAL_DEFAULT_MET_FORCINGS)
     )
 
 
@@ -136,12 +148,89 @@ def read_config_file(config_path: str) -> dict:
 
     """
     # Load the configuration file.
-    with Path.open(Path(config_path), "r", encoding="utf-8") as file:
-        config = yaml.safe_load(file)
+    # Note: pass the whole file to the loader as bytes so that it parses a
+    # single buffer rather than reading through the Python stream API.
+    config = bu.yaml_safe_load(Path(config_path).read_bytes())
 
     return config
 
 
+@functools.lru_cache(maxsize=1)
+def _get_schema_digest() -> str:
+    """Return a digest of the config schema shipped in the package data directory."""
+    schema_path = bu.get_installed_root() / "data" / "config-schema.yml"
+    return hashlib.blake2b(schema_path.read_bytes()).hexdigest()
+
+
+def _get_config_cache_dir() -> Path:
+    """Return the directory used to cache validated config files.
+
+    Following the XDG base directory specification, `$XDG_CACHE_HOME` is used
+    if it is set to an absolute path and `~/.cache` otherwise.
+    """
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", ""))
+    if not cache_home.is_absolute():
+        cache_home = Path("~", ".cache").expanduser()
+    return cache_home / internal.CONFIG_CACHE_DIR
+
+
+def _config_cache_prefix(path: Path) -> str:
+    """Return the file name prefix shared by all cache entries for `path`."""
+    return f"config-{hashlib.blake2b(str(path).encode(), digest_size=8).hexdigest()}"
+
+
+def _config_cache_path(config_path: str) -> Path:
+    """Return the path of the cached validated config for `config_path`.
+
+    The cache key is derived from the absolute path, modification time and size
+    of the config file, the `$PROJECT` environment variable which is used to
+    fill in the optional `project` key, as well as the benchcab version, config
+    schema and default values so that cached configs are invalidated when
+    benchcab is upgraded.
+    """
+    path = Path(config_path).absolute()
+    stat = path.stat()
+    key = hashlib.blake2b(
+        "\0".join(
+            [
+                str(path),
+                str(stat.st_mtime_ns),
+                str(stat.st_size),
+                os.environ.get("PROJECT", ""),
+                benchcab.__version__,
+                _get_schema_digest(),
+                repr(_OPTIONAL_KEY_DEFAULTS),
+                repr(internal.SPATIAL_DEFAULT_MET_FORCINGS),
+            ]
+        ).encode()
+    ).hexdigest()
+    return _get_config_cache_dir() / f"{_config_cache_prefix(path)}-{key}.pkl"
+
+
+def _write_config_cache(cache_path: Path, config: dict):
+    """Cache the validated config, removing stale entries for the same config file.
+
+    The config is written to a temporary file which is then moved into place so
+    that other benchcab processes never read a partially written entry.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp"
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(config, file)
+        tmp_path.replace(cache_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    prefix = cache_path.name.rsplit("-", 1)[0]
+    for stale_path in cache_path.parent.glob(f"{prefix}-*.pkl"):
+        if stale_path != cache_path:
+            stale_path.unlink(missing_ok=True)
+
+
 def read_config(config_path: str) -> dict:
     """Reads the config file and returns a dictionary containing the configurations.
 
@@ -161,10 +250,27 @@ def read_config(config_path: str) -> dict:
         Raised when the configuration file fails validation.
 
     """
+    cache_path = _config_cache_path(config_path)
+    try:
+        with cache_path.open("rb") as file:
+            return pickle.load(file)
+    except Exception:
+        # Note: a missing, corrupt or incompatible (e.g. pickled by another
+        # version of benchcab) cache entry can raise almost any exception when
+        # loaded, fall back to reading the config file in all cases
+        pass
+
     # Read configuration file
     config = read_config_file(config_path)
     # Populate configuration dict with optional keys
     read_optional_key(config)
     # Validate and return.
     validate_config(config)
+
+    # Cache the validated config, ignoring failures (e.g. read-only $HOME).
+    try:
+        _write_config_cache(cache_path, config)
+    except OSError:
+        pass
+
     return config
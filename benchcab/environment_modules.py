@@ -7,25 +7,50 @@ import contextlib
 import sys
 from abc import ABC as AbstractBaseClass  # noqa: N811
 from abc import abstractmethod
+from typing import Callable, Optional
 
 from benchcab.utils import get_logger
 
-sys.path.append("/opt/Modules/v4.3.0/init")
-try:
-    from python import module
-except ImportError:
-    get_logger().error(
-        "Environment modules error: unable to import "
-        "initialization script for python."
-    )
-    # Note: cannot re-raise exception here as this will break pytest
-    # when running pytest locally (outside of Gadi)
+# Path to the environment modules initialization scripts
+MODULES_INIT_DIR = "/opt/Modules/v4.3.0/init"
 
 
 class EnvironmentModulesError(Exception):
     """Custom exception class for environment modules errors."""
 
 
+_module_func: Optional[Callable[..., bool]] = None
+
+
+def _get_module() -> Callable[..., bool]:
+    """Return the `module` function from the environment modules python init script.
+
+    The init script is imported on first call so that importing this module is
+    free on systems without environment modules (e.g. when running pytest
+    locally outside of Gadi).
+
+    Raises
+    ------
+    EnvironmentModulesError
+        Raised when the initialization script for python cannot be imported.
+
+    """
+    global _module_func  # noqa: PLW0603
+    if _module_func is None:
+        if MODULES_INIT_DIR not in sys.path:
+            sys.path.append(MODULES_INIT_DIR)
+        try:
+            from python import module  # noqa: PLC0415
+        except ImportError as exc:
+            msg = (
+                "Environment modules error: unable to import "
+                "initialization script for python."
+            )
+            raise EnvironmentModulesError(msg) from exc
+        _module_func = module
+    return _module_func
+
+
 class EnvironmentModulesInterface(AbstractBaseClass):
     """An abstract class (interface) that defines abstract methods for interacting with the environment modules API.
 
@@ -74,7 +99,7 @@ class EnvironmentModules(EnvironmentModulesInterface):
             True if available, False otherwise.
 
         """
-        return module("is-avail", *args)
+        return _get_module()("is-avail", *args)
 
     def module_is_loaded(self, *args: str) -> bool:
         """Check if module is loaded.
@@ -85,7 +110,7 @@ class EnvironmentModules(EnvironmentModulesInterface):
             True if loaded, False otherwise.
 
         """
-        return module("is-loaded", *args)
+        return _get_module()("is-loaded", *args)
 
     def module_load(self, *args: str) -> None:
         """Load a module.
@@ -96,7 +121,7 @@ class EnvironmentModules(EnvironmentModulesInterface):
             Raised when module fails to load.
 
         """
-        if not module("load", *args):
+        if not _get_module()("load", *args):
             raise EnvironmentModulesError("Failed to load modules: " + " ".join(args))
 
     def module_unload(self, *args: str) -> None:
@@ -108,5 +133,5 @@ class EnvironmentModules(EnvironmentModulesInterface):
             Raised when module fails to unload.
 
         """
-        if not module("unload", *args):
+        if not _get_module()("unload", *args):
             raise EnvironmentModulesError("Failed to unload modules: " + " ".join(args))
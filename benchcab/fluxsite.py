@@ -3,22 +3,26 @@
 
 """A module containing functions and data structures for running fluxsite tasks."""
 
+import functools
 import multiprocessing
-import operator
 import shutil
 import sys
+from collections import defaultdict
+from pathlib import Path
 from subprocess import CalledProcessError
+from typing import Optional
 
 import f90nml
-import flatdict
 import netCDF4
 
-from benchcab import __version__, internal
+import benchcab
+from benchcab import internal
 from benchcab.comparison import ComparisonTask
 from benchcab.model import Model
 from benchcab.utils import get_logger
-from benchcab.utils.fs import chdir, mkdir
-from benchcab.utils.namelist import patch_namelist, patch_remove_namelist
+from benchcab.utils.dict import flatten
+from benchcab.utils.fs import chdir, link_or_copy, mkdir
+from benchcab.utils.namelist import patch_namelist_batch
 from benchcab.utils.subprocess import SubprocessWrapper, SubprocessWrapperInterface
 
 f90_logical_repr = {True: ".true.", False: ".false."}
@@ -59,11 +63,38 @@ class FluxsiteTask:
         self.sci_conf_id = sci_conf_id
         self.sci_config = sci_config
         self.logger = get_logger()
+        self._task_name: Optional[str] = None
+        self._task_dir: Optional[Path] = None
+        self._task_files: Optional[tuple[Path, ...]] = None
+        self._nml: Optional[dict] = None
 
     def get_task_name(self) -> str:
         """Returns the file name convention used for this task."""
-        met_forcing_base_filename = self.met_forcing_file.split(".")[0]
-        return f"{met_forcing_base_filename}_R{self.model.model_id}_S{self.sci_conf_id}"
+        if self._task_name is None:
+            met_forcing_base_filename = self.met_forcing_file.split(".")[0]
+            model_id, sci_conf_id = self.model.model_id, self.sci_conf_id
+            self._task_name = f"{met_forcing_base_filename}_R{model_id}_S{sci_conf_id}"
+        return self._task_name
+
+    def _get_task_dir(self) -> Path:
+        """Returns the directory used to run this task."""
+        if self._task_dir is None:
+            self._task_dir = internal.FLUXSITE_DIRS["TASKS"] / self.get_task_name()
+        return self._task_dir
+
+    def _get_task_files(self) -> tuple[Path, ...]:
+        """Returns the paths of all files created when setting up and running this task."""
+        if self._task_files is None:
+            task_dir = self._get_task_dir()
+            self._task_files = (
+                task_dir / internal.CABLE_EXE,
+                task_dir / internal.CABLE_NML,
+                task_dir / internal.CABLE_VEGETATION_NML,
+                task_dir / internal.CABLE_SOIL_NML,
+                internal.FLUXSITE_DIRS["OUTPUT"] / self.get_output_filename(),
+                internal.FLUXSITE_DIRS["LOG"] / self.get_log_filename(),
+            )
+        return self._task_files
 
     def get_output_filename(self) -> str:
         """Returns the file name convention used for the netcdf output file."""
@@ -85,26 +116,19 @@ class FluxsiteTask:
         5. make appropriate adjustments to namelist files
         6. apply a branch patch if specified
         """
-        self.logger.debug(f"Setting up task: {self.get_task_name()}")
+        self.logger.debug("Setting up task: %s", self.get_task_name())
 
-        mkdir(
-            internal.FLUXSITE_DIRS["TASKS"] / self.get_task_name(),
-            parents=True,
-            exist_ok=True,
-        )
+        mkdir(self._get_task_dir(), parents=True, exist_ok=True)
 
         self.clean_task()
         self.fetch_files()
 
-        nml_path = (
-            internal.FLUXSITE_DIRS["TASKS"] / self.get_task_name() / internal.CABLE_NML
-        )
+        nml_path = self._get_task_dir() / internal.CABLE_NML
 
         self.logger.debug(
-            f"  Adding base configurations to CABLE namelist file {nml_path}"
+            "  Adding base configurations to CABLE namelist file %s", nml_path
         )
-        patch_namelist(
-            nml_path,
+        patches = [
             {
                 "cable": {
                     "filename": {
@@ -130,54 +154,39 @@ class FluxsiteTask:
                     "spinup": False,
                 }
             },
-        )
+        ]
 
         self.logger.debug(
-            f"  Adding science configurations to CABLE namelist file {nml_path}"
+            "  Adding science configurations to CABLE namelist file %s", nml_path
         )
-        patch_namelist(nml_path, self.sci_config)
+        patches.append(self.sci_config)
 
         if self.model.patch:
             self.logger.debug(
-                f"  Adding branch specific configurations to CABLE namelist file {nml_path}"
+                "  Adding branch specific configurations to CABLE namelist file %s",
+                nml_path,
             )
-            patch_namelist(nml_path, self.model.patch)
+            patches.append(self.model.patch)
 
+        patch_removes = []
         if self.model.patch_remove:
             self.logger.debug(
-                f"  Removing branch specific configurations from CABLE namelist file {nml_path}"
+                "  Removing branch specific configurations from CABLE namelist file %s",
+                nml_path,
             )
-            patch_remove_namelist(nml_path, self.model.patch_remove)
+            patch_removes.append(self.model.patch_remove)
+
+        # Note: the namelist file is read and written once for all patches
+        self._nml = patch_namelist_batch(nml_path, patches, patch_removes)
 
     def clean_task(self):
         """Cleans output files, namelist files, log files and cable executables if they exist."""
         self.logger.debug("  Cleaning task")
 
-        task_dir = internal.FLUXSITE_DIRS["TASKS"] / self.get_task_name()
-
-        cable_exe = task_dir / internal.CABLE_EXE
-        if cable_exe.exists():
-            cable_exe.unlink()
-
-        cable_nml = task_dir / internal.CABLE_NML
-        if cable_nml.exists():
-            cable_nml.unlink()
-
-        cable_vegetation_nml = task_dir / internal.CABLE_VEGETATION_NML
-        if cable_vegetation_nml.exists():
-            cable_vegetation_nml.unlink()
-
-        cable_soil_nml = task_dir / internal.CABLE_SOIL_NML
-        if cable_soil_nml.exists():
-            cable_soil_nml.unlink()
-
-        output_file = internal.FLUXSITE_DIRS["OUTPUT"] / self.get_output_filename()
-        if output_file.exists():
-            output_file.unlink()
-
-        log_file = internal.FLUXSITE_DIRS["LOG"] / self.get_log_filename()
-        if log_file.exists():
-            log_file.unlink()
+        for path in self._get_task_files():
+            # Note: unlinking a missing file is cheaper than checking whether
+            # it exists first (one metadata operation instead of two)
+            path.unlink(missing_ok=True)
 
         return self
 
@@ -188,10 +197,10 @@ class FluxsiteTask:
         - copies contents of 'namelists' directory to 'runs/fluxsite/tasks/<task_name>' directory.
         - copies cable executable from source to 'runs/fluxsite/tasks/<task_name>' directory.
         """
-        task_dir = internal.FLUXSITE_DIRS["TASKS"] / self.get_task_name()
+        task_dir = self._get_task_dir()
 
         self.logger.debug(
-            f"  Copying namelist files from {internal.NAMELIST_DIR} to {task_dir}"
+            "  Copying namelist files from %s to %s", internal.NAMELIST_DIR, task_dir
         )
 
         shutil.copytree(internal.NAMELIST_DIR, task_dir, dirs_exist_ok=True)
@@ -199,18 +208,21 @@ class FluxsiteTask:
         exe_src = self.model.get_exe_path()
         exe_dest = task_dir / internal.CABLE_EXE
 
-        self.logger.debug(f"  Copying CABLE executable from {exe_src} to {exe_dest}")
+        self.logger.debug("  Linking CABLE executable from %s to %s", exe_src, exe_dest)
 
-        shutil.copy(exe_src, exe_dest)
+        # Note: the executable is identical across tasks and is replaced rather
+        # than modified in place when rebuilt, so tasks can share it via hard
+        # links. Namelist files are copied since `setup_task` modifies them.
+        link_or_copy(exe_src, exe_dest)
 
         return self
 
     def run(self):
         """Runs a single fluxsite task."""
         task_name = self.get_task_name()
-        task_dir = internal.FLUXSITE_DIRS["TASKS"] / task_name
-        self.logger.debug(f"Running task {task_name}... CABLE standard output ")
-        self.logger.debug(f"saved in {task_dir / internal.CABLE_STDOUT_FILENAME}")
+        task_dir = self._get_task_dir()
+        self.logger.debug("Running task %s... CABLE standard output ", task_name)
+        self.logger.debug("saved in %s", task_dir / internal.CABLE_STDOUT_FILENAME)
 
         try:
             self.run_cable()
@@ -229,7 +241,7 @@ class FluxsiteTask:
         Raises `CableError` when CABLE returns a non-zero exit code.
         """
         task_name = self.get_task_name()
-        task_dir = internal.FLUXSITE_DIRS["TASKS"] / task_name
+        task_dir = self._get_task_dir()
         stdout_path = task_dir / internal.CABLE_STDOUT_FILENAME
 
         try:
@@ -239,7 +251,7 @@ class FluxsiteTask:
                     output_file=stdout_path.relative_to(task_dir),
                 )
         except CalledProcessError as exc:
-            self.logger.debug(f"Error: CABLE returned an error for task {task_name}")
+            self.logger.debug("Error: CABLE returned an error for task %s", task_name)
             raise CableError from exc
 
     def add_provenance_info(self):
@@ -249,23 +261,23 @@ class FluxsiteTask:
         the namelist file used to run cable.
         """
         nc_output_path = internal.FLUXSITE_DIRS["OUTPUT"] / self.get_output_filename()
-        nml = f90nml.read(
-            internal.FLUXSITE_DIRS["TASKS"] / self.get_task_name() / internal.CABLE_NML
-        )
-        self.logger.debug(f"Adding attributes to output file: {nc_output_path}")
+        # Note: reuse the namelist from `setup_task` if the task was set up by
+        # this process, otherwise read it back from the task directory
+        nml = self._nml
+        if nml is None:
+            nml = f90nml.read(self._get_task_dir() / internal.CABLE_NML)
+        self.logger.debug("Adding attributes to output file: %s", nc_output_path)
         with netCDF4.Dataset(nc_output_path, "r+") as nc_output:
             nc_output.setncatts(
                 {
                     **{
                         key: f90_logical_repr[val] if isinstance(val, bool) else val
-                        for key, val in flatdict.FlatDict(
-                            nml["cable"], delimiter="%"
-                        ).items()
+                        for key, val in flatten(nml["cable"], delimiter="%").items()
                     },
                     **{
                         "cable_branch": self.model.repo.get_branch_name(),
                         "svn_revision_number": self.model.repo.get_revision(),
-                        "benchcab_version": __version__,
+                        "benchcab_version": benchcab.__version__,
                     },
                 }
             )
@@ -297,14 +309,38 @@ def run_tasks(tasks: list[FluxsiteTask]):
         task.run()
 
 
+@functools.lru_cache(maxsize=None)
+def _get_met_forcing_file_size(met_forcing_file: str) -> int:
+    """Returns the size in bytes of a met forcing file, or 0 if it does not exist."""
+    try:
+        return (internal.MET_DIR / met_forcing_file).stat().st_size
+    except OSError:
+        return 0
+
+
+def _get_runtime_estimate(task: FluxsiteTask) -> int:
+    """Returns a value proportional to the expected run time of `task`."""
+    return _get_met_forcing_file_size(task.met_forcing_file)
+
+
+def _run_task(task: FluxsiteTask) -> None:
+    """Runs a single fluxsite task in a worker process."""
+    task.run()
+
+
 def run_tasks_in_parallel(
     tasks: list[FluxsiteTask],
     n_processes=internal.FLUXSITE_DEFAULT_PBS["ncpus"],
 ):
-    """Runs tasks in `tasks` in parallel across multiple processes."""
-    run_task = operator.methodcaller("run")
+    """Runs tasks in `tasks` in parallel across multiple processes.
+
+    Tasks are started in order of decreasing met forcing file size (a proxy for
+    the CABLE run time) so that long running tasks do not trail at the end.
+    """
+    tasks = sorted(tasks, key=_get_runtime_estimate, reverse=True)
     with multiprocessing.Pool(n_processes) as pool:
-        pool.map(run_task, tasks, chunksize=1)
+        for _ in pool.imap_unordered(_run_task, tasks, chunksize=1):
+            pass
 
 
 def get_fluxsite_comparisons(tasks: list[FluxsiteTask]) -> list[ComparisonTask]:
@@ -314,6 +350,12 @@ def get_fluxsite_comparisons(tasks: list[FluxsiteTask]) -> list[ComparisonTask]:
     forcing, but differ in realisations. When multiple realisations are
     specified, return all pair wise combinations between all realisations.
     """
+    # Note: group tasks by met forcing and science configuration so that each
+    # task is only paired with the tasks it can be compared against
+    tasks_by_config: dict[tuple[str, int], list[FluxsiteTask]] = defaultdict(list)
+    for task in tasks:
+        tasks_by_config[task.met_forcing_file, task.sci_conf_id].append(task)
+
     output_dir = internal.FLUXSITE_DIRS["OUTPUT"]
     return [
         ComparisonTask(
@@ -326,20 +368,8 @@ def get_fluxsite_comparisons(tasks: list[FluxsiteTask]) -> list[ComparisonTask]:
             ),
         )
         for task_a in tasks
-        for task_b in tasks
-        if task_a.met_forcing_file == task_b.met_forcing_file
-        and task_a.sci_conf_id == task_b.sci_conf_id
-        and task_a.model.model_id < task_b.model.model_id
-        # TODO(Sean): Review later - the following code avoids using a double
-        # for loop to generate pair wise combinations, however we would have
-        # to re-initialize task instances to get access to the output file path
-        # for each task. There is probably a better way but should be fine for
-        # now...
-        # for file_name in fluxsite_forcing_file_names
-        # for sci_conf_id in range(len(science_configurations))
-        # for branch_id_first, branch_id_second in itertools.combinations(
-        #     range(len(realisations)), 2
-        # )
+        for task_b in tasks_by_config[task_a.met_forcing_file, task_a.sci_conf_id]
+        if task_a.model.model_id < task_b.model.model_id
     ]
 
 
@@ -3,13 +3,14 @@
 
 """internal.py: define all runtime constants in a single file."""
 
+import bisect
+import functools
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 from benchcab.utils.pbs import PBSConfig
 
-_, NODENAME, _, _, _ = os.uname()
-
 CONFIG_REQUIRED_KEYS = ["realisations", "modules"]
 
 # Parameters for job script:
@@ -22,13 +23,21 @@ FLUXSITE_DEFAULT_PBS: PBSConfig = {
 }
 FLUXSITE_DEFAULT_MULTIPROCESS = True
 
+# Maximum number of spatial tasks submitted concurrently
+SPATIAL_MAX_WORKERS = 16
+
+# Maximum number of bitwise comparison processes run concurrently. Comparisons
+# are bound by file system I/O rather than CPU, so this is independent of ncpus.
+COMPARISON_MAX_PROCESSES = 8
+
 # DIRECTORY PATHS/STRUCTURE:
 
 # Default system paths in Unix
 SYSTEM_PATHS = ["/bin", "/usr/bin", "/usr/local/bin"]
 
-# Path to the user's home directory
-HOME_DIR = Path(os.environ["HOME"])
+# Path to the directory used to cache validated config files, relative to the
+# user's cache directory ($XDG_CACHE_HOME or ~/.cache)
+CONFIG_CACHE_DIR = Path("benchcab")
 
 # Relative path to directory containing CABLE source codes
 SRC_DIR = Path("src")
@@ -175,71 +184,120 @@ DEFAULT_SCIENCE_CONFIGURATIONS = [
 
 # Contains the FLUXNET site ids for each met forcing file associated with an experiment
 # on modelevaluation.org
-MEORG_EXPERIMENTS = {
-    # List of FLUXNET site ids associated with the 'Five site test'
-    # experiment (workspace: benchcab-evaluation), see:
-    # https://modelevaluation.org/experiment/display/xNZx2hSvn4PMKAa9R
-    "five-site-test": [
-        "AU-Tum",
-        "AU-How",
-        "FI-Hyy",
-        "US-Var",
-        "US-Whs",
-    ],
-    # List of FLUXNET site ids associated with the 'Forty two site test'
-    # experiment (workspace: benchcab-evaluation), see:
-    # https://modelevaluation.org/experiment/display/urTKSXEsojdvEPwdR
-    "forty-two-site-test": [
-        "AU-Tum",
-        "AU-How",
-        "AU-Cum",
-        "AU-ASM",
-        "AU-GWW",
-        "AU-Ctr",
-        "AU-Stp",
-        "BR-Sa3",
-        "CA-Qfo",
-        "CH-Dav",
-        "CN-Cha",
-        "CN-Din",
-        "DE-Geb",
-        "DE-Gri",
-        "DE-Hai",
-        "DE-Tha",
-        "DK-Sor",
-        "FI-Hyy",
-        "FR-Gri",
-        "FR-Pue",
-        "GF-Guy",
-        "IT-Lav",
-        "IT-MBo",
-        "IT-Noe",
-        "NL-Loo",
-        "RU-Fyo",
-        "US-Blo",
-        "US-GLE",
-        "US-Ha1",
-        "US-Me2",
-        "US-MMS",
-        "US-Myb",
-        "US-NR1",
-        "US-PFa",
-        "US-FPe",
-        "US-SRM",
-        "US-SRG",
-        "US-Ton",
-        "US-UMB",
-        "US-Var",
-        "US-Whs",
-        "US-Wkg",
-    ],
-}
+MEORG_EXPERIMENTS = MappingProxyType(
+    {
+        # List of FLUXNET site ids associated with the 'Five site test'
+        # experiment (workspace: benchcab-evaluation), see:
+        # https://modelevaluation.org/experiment/display/xNZx2hSvn4PMKAa9R
+        "five-site-test": (
+            "AU-Tum",
+            "AU-How",
+            "FI-Hyy",
+            "US-Var",
+            "US-Whs",
+        ),
+        # List of FLUXNET site ids associated with the 'Forty two site test'
+        # experiment (workspace: benchcab-evaluation), see:
+        # https://modelevaluation.org/experiment/display/urTKSXEsojdvEPwdR
+        "forty-two-site-test": (
+            "AU-Tum",
+            "AU-How",
+            "AU-Cum",
+            "AU-ASM",
+            "AU-GWW",
+            "AU-Ctr",
+            "AU-Stp",
+            "BR-Sa3",
+            "CA-Qfo",
+            "CH-Dav",
+            "CN-Cha",
+            "CN-Din",
+            "DE-Geb",
+            "DE-Gri",
+            "DE-Hai",
+            "DE-Tha",
+            "DK-Sor",
+            "FI-Hyy",
+            "FR-Gri",
+            "FR-Pue",
+            "GF-Guy",
+            "IT-Lav",
+            "IT-MBo",
+            "IT-Noe",
+            "NL-Loo",
+            "RU-Fyo",
+            "US-Blo",
+            "US-GLE",
+            "US-Ha1",
+            "US-Me2",
+            "US-MMS",
+            "US-Myb",
+            "US-NR1",
+            "US-PFa",
+            "US-FPe",
+            "US-SRM",
+            "US-SRG",
+            "US-Ton",
+            "US-UMB",
+            "US-Var",
+            "US-Whs",
+            "US-Wkg",
+        ),
+    }
+)
+
+# Site ids in the 'Five site test' experiment that can be specified individually
+FIVE_SITE_TEST_SITE_IDS = frozenset(MEORG_EXPERIMENTS["five-site-test"])
 
 FLUXSITE_DEFAULT_EXPERIMENT = "forty-two-site-test"
 
 OPTIONAL_COMMANDS = ["fluxsite-bitwise-cmp"]
 
 
+@functools.lru_cache(maxsize=1)
+def get_nodename() -> str:
+    """Return the network name of the current machine."""
+    return os.uname().nodename
+
+
+@functools.lru_cache(maxsize=1)
+def get_met_dir_index() -> tuple[str, ...]:
+    """Return the sorted basenames of all files in MET_DIR.
+
+    MET_DIR is scanned once per process. `FileNotFoundError` is raised (and not
+    cached) if MET_DIR does not exist.
+    """
+    with os.scandir(MET_DIR) as entries:
+        return tuple(sorted(entry.name for entry in entries))
+
+
+def get_met_file_names(site_id: str) -> list[str]:
+    """Get the met forcing file basenames in MET_DIR for a site id.
+
+    This is equivalent to globbing MET_DIR for `f"{site_id}*"` but uses the
+    cached index of MET_DIR. An empty list is returned if MET_DIR does not exist.
+    """
+    try:
+        met_dir_index = get_met_dir_index()
+    except FileNotFoundError:
+        return []
+    file_names = []
+    for file_name in met_dir_index[bisect.bisect_left(met_dir_index, site_id) :]:
+        if not file_name.startswith(site_id):
+            break
+        file_names.append(file_name)
+    return file_names
+
+
+def _get_met_forcing_file_name(site_id: str) -> str:
+    """Get the met forcing file basename in MET_DIR for a site id."""
+    file_names = get_met_file_names(site_id)
+    if not file_names:
+        msg = f"Failed to infer met file for site id '{site_id}' in {MET_DIR}."
+        raise FileNotFoundError(msg)
+    return file_names[0]
+
+
 def get_met_forcing_file_names(experiment: str) -> list[str]:
     """Get a list of meteorological forcing file basenames specified by an experiment.
 
@@ -248,13 +306,12 @@ def get_met_forcing_file_names(experiment: str) -> list[str]:
 
     Assume all site ids map uniquely to a met file in MET_DIR.
     """
-    if experiment in MEORG_EXPERIMENTS["five-site-test"]:
+    if experiment in FIVE_SITE_TEST_SITE_IDS:
         # the user is specifying a single met site
-        return [next(MET_DIR.glob(f"{experiment}*")).name]
+        return [_get_met_forcing_file_name(experiment)]
 
     file_names = [
-        next(MET_DIR.glob(f"{site_id}*")).name
-        for site_id in MEORG_EXPERIMENTS[experiment]
+        _get_met_forcing_file_name(site_id) for site_id in MEORG_EXPERIMENTS[experiment]
     ]
 
     return file_names
@@ -3,11 +3,42 @@
 import shutil
 import sys
 
-from benchcab.benchcab import Benchcab
 from benchcab.cli import generate_parser
 from benchcab.utils import get_logger
 
 
+class _LazyBenchcab:
+    """Defers importing and constructing `Benchcab` until a subcommand is dispatched.
+
+    This avoids importing the application and its dependencies when `benchcab`
+    only prints help or version information.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self._kwargs = kwargs
+        self._app = None
+        # Note: constructing `Benchcab` used to create the logger at its default
+        # (debug) level before arguments were parsed. Keep that effective level
+        # so that subprocess output is still shown when constructing lazily.
+        get_logger()
+
+    def __getattr__(self, name: str):
+        # Note: only public `Benchcab` methods are dispatched, this also avoids
+        # dispatching special attributes looked up by e.g. `copy` or `pickle`
+        if name.startswith("_"):
+            msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        def dispatch(**kwargs):
+            if self._app is None:
+                from benchcab.benchcab import Benchcab  # noqa: PLC0415
+
+                self._app = Benchcab(**self._kwargs)
+            return getattr(self._app, name)(**kwargs)
+
+        return dispatch
+
+
 def parse_and_dispatch(parser):
     """Parse arguments for the script and dispatch to the correct function.
 
@@ -37,7 +68,7 @@ def main():
 
     This is required for setup.py entry_points
     """
-    app = Benchcab(benchcab_exe_path=shutil.which(sys.argv[0]))
+    app = _LazyBenchcab(benchcab_exe_path=shutil.which(sys.argv[0]))
     parser = generate_parser(app)
     parse_and_dispatch(parser)
 
@@ -3,10 +3,11 @@
 
 """Contains functions and data structures relating to CABLE models."""
 
+import fnmatch
 import os
+import re
 import shlex
-import shutil
-import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +18,30 @@ from benchcab.utils.fs import chdir, copy2, rename
 from benchcab.utils.repo import GitRepo, LocalRepo, Repo
 from benchcab.utils.subprocess import SubprocessWrapper, SubprocessWrapperInterface
 
+# Environment variables used to build CABLE which do not depend on the
+# environment of the current process
+BUILD_ENV_COMMON = {"CFLAGS": "-O2 -fp-model precise", "LD": "-lnetcdf -lnetcdff"}
+BUILD_ENV_SERIAL = BUILD_ENV_COMMON | {"FC": "ifort"}
+BUILD_ENV_MPI = BUILD_ENV_COMMON | {"FC": "mpif90"}
+
+# Matches `module` as a token delimited by the whitespace characters used by `shlex`
+MODULE_TOKEN_RE = re.compile(r"(?:^|[ \t\r\n])module(?:[ \t\r\n]|$)")
+
+
+def _compile_offline_source_patterns() -> dict[Path, list[re.Pattern]]:
+    """Compile `internal.OFFLINE_SOURCE_FILES` grouped by directory."""
+    patterns: dict[Path, list[re.Pattern]] = {}
+    for pattern in internal.OFFLINE_SOURCE_FILES:
+        patterns.setdefault(Path(pattern).parent, []).append(
+            re.compile(fnmatch.translate(Path(pattern).name))
+        )
+    return patterns
+
+
+# Compiled file name patterns in `internal.OFFLINE_SOURCE_FILES` grouped by the
+# directory (relative to the CABLE source directory) they apply to
+OFFLINE_SOURCE_PATTERNS = _compile_offline_source_patterns()
+
 
 class Model:
     """A class used to represent a CABLE model version."""
@@ -65,6 +90,19 @@ class Model:
         if isinstance(repo, (GitRepo, LocalRepo)):
             self.src_dir = Path("src")
 
+        # Paths used when building the model
+        self._repo_dir = internal.SRC_DIR / self.name
+        self._src_root = self._repo_dir / self.src_dir
+        self._offline_dir = self._src_root / "offline"
+        self._tmp_build_dirs = {
+            False: self._src_root / internal.TMP_BUILD_DIR,
+            True: self._src_root / internal.TMP_BUILD_DIR_MPI,
+        }
+        self._exe_paths = {
+            False: self._offline_dir / internal.CABLE_EXE,
+            True: self._offline_dir / internal.CABLE_MPI_EXE,
+        }
+
     @property
     def model_id(self) -> int:
         """Get or set the model ID."""
@@ -79,17 +117,17 @@ class Model:
 
     def get_exe_path(self, mpi=False) -> Path:
         """Return the path to the built executable."""
-        return (
-            internal.SRC_DIR
-            / self.name
-            / self.src_dir
-            / "offline"
-            / (internal.CABLE_MPI_EXE if mpi else internal.CABLE_EXE)
-        )
+        return self._exe_paths[bool(mpi)]
 
     def custom_build(self, modules: list[str]):
-        """Build CABLE using a custom build script."""
-        build_script_path = internal.SRC_DIR / self.name / self.build_script
+        """Build CABLE using a custom build script.
+
+        Lines that call environment modules are filtered out of the build
+        script into `tmp-build.sh` next to the build script, which is then run
+        with the interpreter given by the shebang of the build script (`bash`
+        if there is none).
+        """
+        build_script_path = self._repo_dir / self.build_script
 
         if not build_script_path.is_file():
             msg = (
@@ -101,83 +139,100 @@ class Model:
 
         tmp_script_path = build_script_path.parent / "tmp-build.sh"
 
-        self.logger.debug(f"Copying {build_script_path} to {tmp_script_path}")
-        shutil.copy(build_script_path, tmp_script_path)
-
-        self.logger.debug(f"chmod +x {tmp_script_path}")
-        tmp_script_path.chmod(tmp_script_path.stat().st_mode | stat.S_IEXEC)
-
         self.logger.debug(
-            f"Modifying {tmp_script_path.name}: remove lines that call environment modules"
+            f"Writing {build_script_path} to {tmp_script_path}: remove lines that "
+            "call environment modules"
         )
+        with build_script_path.open("r", encoding="utf-8") as file:
+            lines = [line for line in file if not calls_module(line)]
+        with tmp_script_path.open("w", encoding="utf-8") as file:
+            file.writelines(lines)
 
-        remove_module_lines(tmp_script_path)
-
+        interpreter = get_interpreter(lines[0] if lines else "")
         with chdir(build_script_path.parent), self.modules_handler.load(modules):
-            self.subprocess_handler.run_cmd(f"./{tmp_script_path.name}")
+            self.subprocess_handler.run_cmd(f"{interpreter} ./{tmp_script_path.name}")
 
     def pre_build(self, mpi=False):
         """Runs CABLE pre-build steps."""
-        path_to_repo = internal.SRC_DIR / self.name
-        tmp_dir = (
-            path_to_repo
-            / self.src_dir
-            / (internal.TMP_BUILD_DIR_MPI if mpi else internal.TMP_BUILD_DIR)
-        )
+        tmp_dir = self._tmp_build_dirs[bool(mpi)]
         if not tmp_dir.exists():
             self.logger.debug(f"mkdir {tmp_dir}")
             tmp_dir.mkdir()
 
-        for pattern in internal.OFFLINE_SOURCE_FILES:
-            for path in (path_to_repo / self.src_dir).glob(pattern):
-                if not path.is_file():
-                    continue
-                copy2(path, tmp_dir)
+        source_files = find_offline_source_files(self._src_root)
+        with ThreadPoolExecutor() as executor:
+            # Note: consume the results so that exceptions are re-raised
+            list(executor.map(lambda path: copy2(path, tmp_dir), source_files))
 
-        copy2(path_to_repo / self.src_dir / "offline" / "Makefile", tmp_dir)
+        copy2(self._offline_dir / "Makefile", tmp_dir)
 
     def run_build(self, modules: list[str], mpi=False):
         """Runs CABLE build scripts."""
-        path_to_repo = internal.SRC_DIR / self.name
-        tmp_dir = (
-            path_to_repo
-            / self.src_dir
-            / (internal.TMP_BUILD_DIR_MPI if mpi else internal.TMP_BUILD_DIR)
-        )
+        tmp_dir = self._tmp_build_dirs[bool(mpi)]
 
         with chdir(tmp_dir), self.modules_handler.load(modules):
-            env = os.environ.copy()
-            env["NCDIR"] = f"{env['NETCDF_ROOT']}/lib/Intel"
-            env["NCMOD"] = f"{env['NETCDF_ROOT']}/include/Intel"
-            env["CFLAGS"] = "-O2 -fp-model precise"
-            env["LDFLAGS"] = f"-L{env['NETCDF_ROOT']}/lib/Intel -O0"
-            env["LD"] = "-lnetcdf -lnetcdff"
-            env["FC"] = "mpif90" if mpi else "ifort"
+            # Note: NETCDF_ROOT is defined by the netcdf module loaded above
+            netcdf_root = os.environ["NETCDF_ROOT"]
+            env = os.environ | {
+                "NCDIR": f"{netcdf_root}/lib/Intel",
+                "NCMOD": f"{netcdf_root}/include/Intel",
+                "LDFLAGS": f"-L{netcdf_root}/lib/Intel -O0",
+                **(BUILD_ENV_MPI if mpi else BUILD_ENV_SERIAL),
+            }
 
             self.subprocess_handler.run_cmd("make mpi" if mpi else "make", env=env)
 
     def post_build(self, mpi=False):
         """Runs CABLE post-build steps."""
-        path_to_repo = internal.SRC_DIR / self.name
-        tmp_dir = (
-            path_to_repo
-            / self.src_dir
-            / (internal.TMP_BUILD_DIR_MPI if mpi else internal.TMP_BUILD_DIR)
-        )
+        tmp_dir = self._tmp_build_dirs[bool(mpi)]
         exe = internal.CABLE_MPI_EXE if mpi else internal.CABLE_EXE
 
-        rename(
-            tmp_dir / exe,
-            path_to_repo / self.src_dir / "offline" / exe,
-        )
-
-
-def remove_module_lines(file_path: Path) -> None:
-    """Remove lines from `file_path` that call the environment modules package."""
-    with file_path.open("r", encoding="utf-8") as file:
-        contents = file.read()
-    with file_path.open("w", encoding="utf-8") as file:
-        for line in contents.splitlines(True):
-            cmds = shlex.split(line, comments=True)
-            if "module" not in cmds:
-                file.write(line)
+        rename(tmp_dir / exe, self._offline_dir / exe)
+
+
+def find_offline_source_files(src_dir: Path) -> list[Path]:
+    """Return the files in `src_dir` that match `internal.OFFLINE_SOURCE_FILES`.
+
+    Each directory is scanned once and file names are matched against the
+    precompiled patterns in `OFFLINE_SOURCE_PATTERNS`.
+    """
+    source_files = []
+    for subdir, patterns in OFFLINE_SOURCE_PATTERNS.items():
+        try:
+            with os.scandir(src_dir / subdir) as entries:
+                source_files.extend(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.is_file()
+                    and any(pattern.match(entry.name) for pattern in patterns)
+                )
+        except FileNotFoundError:
+            continue
+    return source_files
+
+
+def get_interpreter(script: str) -> str:
+    """Return the interpreter command given by the shebang of `script`.
+
+    `bash` is returned if `script` does not start with a shebang.
+    """
+    if script.startswith("#!"):
+        interpreter = script[2:].split("\n", 1)[0].strip()
+        if interpreter:
+            return interpreter
+    return "bash"
+
+
+def calls_module(line: str) -> bool:
+    """Return True if the shell script line `line` calls `module`.
+
+    This is equivalent to checking for a `module` token in
+    `shlex.split(line, comments=True)`. A precompiled regex is used instead,
+    and shlex is only used for lines with quotes or escapes, which the regex
+    does not tokenize correctly.
+    """
+    # Note: quotes and escapes can hide or create a `#` or a `module` token, so
+    # check for them before truncating the line at the first comment
+    if any(char in line for char in "'\"\\"):
+        return "module" in shlex.split(line, comments=True)
+    return MODULE_TOKEN_RE.search(line.split("#", 1)[0]) is not None
@@ -3,17 +3,17 @@
 
 """A module containing functions and data structures for running spatial tasks."""
 
-from typing import Optional
-
-import git
-import yaml
+import itertools
+import shlex
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator, Optional
 
 from benchcab import internal
 from benchcab.model import Model
-from benchcab.utils import get_logger
+from benchcab.utils import get_logger, yaml_safe_dump, yaml_safe_load
 from benchcab.utils.dict import deep_update
-from benchcab.utils.fs import chdir
-from benchcab.utils.namelist import patch_namelist, patch_remove_namelist
+from benchcab.utils.namelist import patch_namelist_batch
 from benchcab.utils.subprocess import SubprocessWrapper, SubprocessWrapperInterface
 
 
@@ -38,10 +38,22 @@ class SpatialTask:
         self.sci_config = sci_config
         self.payu_args = payu_args
         self.logger = get_logger()
+        self._task_name: Optional[str] = None
+        self._task_dir: Optional[Path] = None
 
     def get_task_name(self) -> str:
         """Returns the file name convention used for this task."""
-        return f"{self.met_forcing_name}_R{self.model.model_id}_S{self.sci_conf_id}"
+        if self._task_name is None:
+            self._task_name = (
+                f"{self.met_forcing_name}_R{self.model.model_id}_S{self.sci_conf_id}"
+            )
+        return self._task_name
+
+    def _get_task_dir(self) -> Path:
+        """Returns the payu control directory for this task."""
+        if self._task_dir is None:
+            self._task_dir = internal.SPATIAL_TASKS_DIR / self.get_task_name()
+        return self._task_dir
 
     def setup_task(self, payu_config: Optional[dict] = None):
         """Does all file manipulations to run cable with payu for this task."""
@@ -52,18 +64,24 @@ class SpatialTask:
         self.update_namelist()
 
     def clone_experiment(self):
-        """Clone the payu experiment from GitHub."""
+        """Clone the payu experiment from GitHub.
+
+        Only the latest commit is required to run the experiment, so a shallow
+        clone is made.
+        """
         url = self.met_forcing_payu_experiment
-        path = internal.SPATIAL_TASKS_DIR / self.get_task_name()
-        self.logger.debug(f"git clone {url} {path}")
-        _ = git.Repo.clone_from(url, path)
+        path = self._get_task_dir()
+        self.subprocess_handler.run_cmd(
+            "git clone --depth=1 --single-branch -- "
+            f"{shlex.quote(url)} {shlex.quote(str(path))}"
+        )
 
     def configure_experiment(self, payu_config: Optional[dict] = None):
         """Configure the payu experiment for this task."""
-        task_dir = internal.SPATIAL_TASKS_DIR / self.get_task_name()
+        task_dir = self._get_task_dir()
         exp_config_path = task_dir / "config.yaml"
         with exp_config_path.open("r", encoding="utf-8") as file:
-            config = yaml.safe_load(file)
+            config = yaml_safe_load(file)
             if config is None:
                 config = {}
 
@@ -83,54 +101,74 @@ class SpatialTask:
         config["laboratory"] = str(internal.PAYU_LABORATORY_DIR.absolute())
 
         with exp_config_path.open("w", encoding="utf-8") as file:
-            yaml.dump(config, file)
+            yaml_safe_dump(config, file)
 
     def update_namelist(self):
         """Update the namelist file for this task."""
-        nml_path = (
-            internal.SPATIAL_TASKS_DIR / self.get_task_name() / internal.CABLE_NML
-        )
+        nml_path = self._get_task_dir() / internal.CABLE_NML
         self.logger.debug(
             f"  Adding science configurations to CABLE namelist file {nml_path}"
         )
-        patch_namelist(nml_path, self.sci_config)
+        patches = [self.sci_config]
 
         if self.model.patch:
             self.logger.debug(
                 f"  Adding branch specific configurations to CABLE namelist file {nml_path}"
             )
-            patch_namelist(nml_path, self.model.patch)
+            patches.append(self.model.patch)
 
+        patch_removes = []
         if self.model.patch_remove:
             self.logger.debug(
                 f"  Removing branch specific configurations from CABLE namelist file {nml_path}"
             )
-            patch_remove_namelist(nml_path, self.model.patch_remove)
+            patch_removes.append(self.model.patch_remove)
+
+        patch_namelist_batch(nml_path, patches, patch_removes)
 
     def run(self) -> None:
         """Runs a single spatial task."""
-        task_dir = internal.SPATIAL_TASKS_DIR / self.get_task_name()
-        with chdir(task_dir):
-            self.subprocess_handler.run_cmd(
-                f"payu run {self.payu_args}" if self.payu_args else "payu run",
-            )
+        # Note: pass the task directory as the working directory of the
+        # subprocess rather than using `chdir` so that tasks can be run
+        # concurrently from multiple threads.
+        self.subprocess_handler.run_cmd(
+            f"payu run {self.payu_args}" if self.payu_args else "payu run",
+            cwd=self._get_task_dir(),
+        )
 
 
-def run_tasks(tasks: list[SpatialTask]):
-    """Runs tasks in `tasks` sequentially."""
-    for task in tasks:
-        task.run()
+def run_tasks(tasks: list[SpatialTask], max_workers: Optional[int] = None):
+    """Runs tasks in `tasks` concurrently across a pool of threads.
 
+    Each task submits a payu experiment, which is mostly spent waiting on I/O
+    and PBS, so submissions are overlapped rather than run one after another.
+    """
+    if not tasks:
+        return
+    with ThreadPoolExecutor(
+        max_workers=max_workers or min(internal.SPATIAL_MAX_WORKERS, len(tasks))
+    ) as executor:
+        futures = [executor.submit(task.run) for task in tasks]
+        for future in as_completed(futures):
+            # Note: re-raise any exception raised by a task
+            future.result()
 
-def get_spatial_tasks(
+
+def iter_spatial_tasks(
     models: list[Model],
     met_forcings: dict[str, str],
     science_configurations: list[dict],
     payu_args: Optional[str] = None,
-):
-    """Returns a list of spatial tasks to run."""
-    tasks = [
-        SpatialTask(
+) -> Iterator[SpatialTask]:
+    """Yields the spatial tasks to run."""
+    for (
+        model,
+        (met_forcing_name, met_forcing_payu_experiment),
+        (sci_conf_id, sci_config),
+    ) in itertools.product(
+        models, met_forcings.items(), enumerate(science_configurations)
+    ):
+        yield SpatialTask(
             model=model,
             met_forcing_name=met_forcing_name,
             met_forcing_payu_experiment=met_forcing_payu_experiment,
@@ -138,8 +176,20 @@ def get_spatial_tasks(
             sci_config=sci_config,
             payu_args=payu_args,
         )
-        for model in models
-        for met_forcing_name, met_forcing_payu_experiment in met_forcings.items()
-        for sci_conf_id, sci_config in enumerate(science_configurations)
-    ]
-    return tasks
+
+
+def get_spatial_tasks(
+    models: list[Model],
+    met_forcings: dict[str, str],
+    science_configurations: list[dict],
+    payu_args: Optional[str] = None,
+) -> list[SpatialTask]:
+    """Returns a list of spatial tasks to run."""
+    return list(
+        iter_spatial_tasks(
+            models=models,
+            met_forcings=met_forcings,
+            science_configurations=science_configurations,
+            payu_args=payu_args,
+        )
+    )
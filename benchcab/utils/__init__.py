@@ -1,25 +1,45 @@
 # Copyright 2022 ACCESS-NRI and contributors. See the top-level COPYRIGHT file for details.
 # SPDX-License-Identifier: Apache-2.0
 
-# ruff: noqa: PTH118
-
 """Top-level utilities."""
+import copy
+import functools
 import json
 import logging
-import os
-import pkgutil
 import sys
 from importlib import resources
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+
+def yaml_safe_load(stream) -> Any:
+    """Parse a YAML document with the fastest available safe loader.
+
+    The libyaml-backed loader is used if PyYAML was built against libyaml.
+    `yaml` is imported here so that it is only loaded when YAML is read.
+    """
+    import yaml  # noqa: PLC0415
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+def yaml_safe_dump(data: Any, stream) -> None:
+    """Serialize `data` as YAML to `stream` with the fastest available safe dumper."""
+    import yaml  # noqa: PLC0415
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    yaml.dump(data, stream, Dumper=dumper)
 
-import yaml
-from jinja2 import BaseLoader, Environment
 
 # List of one-argument decoding functions.
-PACKAGE_DATA_DECODERS = dict(json=json.loads, yml=yaml.safe_load)
+PACKAGE_DATA_DECODERS = dict(json=json.loads, yml=yaml_safe_load)
 
 
+@functools.lru_cache(maxsize=1)
 def get_installed_root() -> Path:
     """Get the installed root of the benchcab installation.
 
@@ -29,12 +49,15 @@ def get_installed_root() -> Path:
         Path to the installed root.
 
     """
-    return Path(resources.files("benchcab"))
+    return Path(str(resources.files("benchcab")))
 
 
 def load_package_data(filename: str) -> Union[str, dict]:
     """Load data out of the installed package data directory.
 
+    Package data is read and decoded once per file. Decoded dictionaries are
+    copied on each call so that callers are free to modify them.
+
     Parameters
     ----------
     filename : str
@@ -46,14 +69,22 @@ def load_package_data(filename: str) -> Union[str, dict]:
         String or dictionary, depending on format of data read.
 
     """
+    data = _load_package_data(filename)
+    # Note: `dict` refers to the `benchcab.utils.dict` submodule once imported
+    return data if isinstance(data, str) else copy.deepcopy(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_package_data(filename: str) -> Union[str, dict]:
+    """Read and decode a file from the package data directory."""
     # Work out the encoding of requested file.
-    ext = filename.split(".")[-1]
+    ext = filename.rsplit(".", 1)[-1]
 
     # Alias yaml and yml.
     ext = ext if ext != "yaml" else "yml"
 
     # Extract from the installations data directory.
-    raw = pkgutil.get_data("benchcab", os.path.join("data", filename)).decode("utf-8")
+    raw = (resources.files("benchcab") / "data" / filename).read_text(encoding="utf-8")
 
     # If there is no explicit decoder, just return the raw text
     if ext not in PACKAGE_DATA_DECODERS.keys():
@@ -63,6 +94,25 @@ def load_package_data(filename: str) -> Union[str, dict]:
     return PACKAGE_DATA_DECODERS[ext](raw)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_jinja_env() -> "Environment":
+    """Get the Jinja2 environment used to load and compile templates.
+
+    Templates loaded from the package data directory are compiled once and
+    cached by the environment. `jinja2` is imported here so that it is only
+    loaded when a template is rendered.
+    """
+    from jinja2 import Environment, PackageLoader  # noqa: PLC0415
+
+    return Environment(loader=PackageLoader("benchcab", "data"), auto_reload=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_string_template(template: str) -> "Template":
+    """Compile a template string, caching the result."""
+    return _get_jinja_env().from_string(template)
+
+
 def interpolate_string_template(template, **kwargs):
     """Interpolate a string template with kwargs.
 
@@ -79,8 +129,7 @@ def interpolate_string_template(template, **kwargs):
         Interpolated string.
 
     """
-    _template = Environment(loader=BaseLoader()).from_string(template)
-    return _template.render(**kwargs)
+    return _compile_string_template(template).render(**kwargs)
 
 
 def interpolate_file_template(template_file, **kwargs):
@@ -99,8 +148,24 @@ def interpolate_file_template(template_file, **kwargs):
         Interpolated template string.
 
     """
-    template = load_package_data(template_file)
-    return interpolate_string_template(template, **kwargs)
+    return _get_jinja_env().get_template(template_file).render(**kwargs)
+
+
+LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(levelname)s - %(module)s.%(filename)s:%(lineno)s - %(message)s"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_log_handler() -> logging.Handler:
+    """Get the stdout log handler shared by all benchcab loggers.
+
+    The handler is created on first use rather than at import time so that it
+    binds to `sys.stdout` as it is when logging is first set up.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(LOG_FORMATTER)
+    return handler
 
 
 def get_logger(name="benchcab", level="debug"):
@@ -131,15 +196,9 @@ def get_logger(name="benchcab", level="debug"):
     level = getattr(logging, level.upper())
     logger.setLevel(level)
 
-    # Create the formatter
-    log_format = (
-        "%(asctime)s - %(levelname)s - %(module)s.%(filename)s:%(lineno)s - %(message)s"
-    )
-    formatter = logging.Formatter(log_format)
-
-    # Create/set the handler to point to stdout
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    # Attach the shared handler that points to stdout
+    handler = _get_log_handler()
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
 
     return logger
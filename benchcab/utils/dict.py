@@ -3,6 +3,7 @@
 
 """Utility functions for manipulating nested dictionaries."""
 
+import copy
 from typing import Any, Dict, TypeVar
 
 # fmt: off
@@ -39,3 +40,35 @@ def deep_del(
             else:
                 del updated_mapping[key]
     return updated_mapping
+
+
+def deep_setdefault(
+    mapping: Dict[KeyType, Any], defaults: Dict[KeyType, Any]
+) -> Dict[KeyType, Any]:
+    """Inserts (in place) all key-value pairs in `defaults` that are missing from `mapping`.
+
+    Nested dictionaries are merged recursively and inserted values are deep
+    copies of those in `defaults`.
+    """
+    for key, value in defaults.items():
+        if key not in mapping:
+            mapping[key] = copy.deepcopy(value)
+        elif isinstance(mapping[key], dict) and isinstance(value, dict):
+            deep_setdefault(mapping[key], value)
+    return mapping
+
+
+def flatten(mapping: Dict[str, Any], delimiter: str = ".") -> Dict[str, Any]:
+    """Flattens nested dictionaries in `mapping` into a single level dictionary.
+
+    Keys of nested values are joined with `delimiter`, for example
+    `{"a": {"b": 1}}` is flattened to `{"a.b": 1}`.
+    """
+    flat_mapping = {}
+    for key, value in mapping.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in flatten(value, delimiter).items():
+                flat_mapping[f"{key}{delimiter}{sub_key}"] = sub_value
+        else:
+            flat_mapping[key] = value
+    return flat_mapping
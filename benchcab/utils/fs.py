@@ -4,7 +4,9 @@
 """Contains utility functions for interacting with the file system."""
 
 import contextlib
+import errno
 import os
+import re
 import shutil
 from pathlib import Path
 
@@ -15,7 +17,9 @@ from benchcab.utils import get_logger
 def chdir(newdir: Path):
     """Context manager `cd`."""
     prevdir = Path.cwd()
-    get_logger().debug(f"Changing current working directory from {prevdir} to {newdir}")
+    get_logger().debug(
+        "Changing current working directory from %s to %s", prevdir, newdir
+    )
     os.chdir(newdir.expanduser())
     try:
         yield
@@ -25,16 +29,36 @@ def chdir(newdir: Path):
 
 def rename(src: Path, dest: Path):
     """A wrapper around `pathlib.Path.rename` with optional loggging."""
-    get_logger().debug(f"mv {src} {dest}")
+    get_logger().debug("mv %s %s", src, dest)
     src.rename(dest)
 
 
 def copy2(src: Path, dest: Path):
     """A wrapper around `shutil.copy2` with optional logging."""
-    get_logger().debug(f"cp -p {src} {dest}")
+    get_logger().debug("cp -p %s %s", src, dest)
     shutil.copy2(src, dest)
 
 
+def link_or_copy(src: Path, dest: Path):
+    """Hard link `src` to `dest`, falling back to `shutil.copy` if linking fails.
+
+    An existing `dest` is removed first so that it is replaced rather than
+    written through. Copying is only used when `dest` cannot be linked to
+    `src`, e.g. when it is on a different file system. Only use this for files
+    that are replaced rather than modified in place, as the linked file shares
+    its contents with `src`.
+    """
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(src, dest)
+        get_logger().debug("ln %s %s", src, dest)
+    except OSError as exc:
+        if exc.errno not in (errno.EXDEV, errno.EPERM):
+            raise
+        get_logger().debug("cp %s %s", src, dest)
+        shutil.copy(src, dest)
+
+
 def next_path(path_pattern: str, path: Path = Path(), sep: str = "-") -> Path:
     """Find the next free path.
 
@@ -48,15 +72,22 @@ def next_path(path_pattern: str, path: Path = Path(), sep: str = "-") -> Path:
     file-3.txt
     """
     loc_pattern = Path(path_pattern)
-    new_file_index = 1
-    common_filename, _ = loc_pattern.stem.split(sep)
+    common_filename = loc_pattern.stem.rsplit(sep, 1)[0]
+    suffix = loc_pattern.suffix
+
+    file_name_re = re.compile(
+        re.escape(common_filename + sep) + r"(\d+)" + re.escape(suffix)
+    )
 
-    pattern_files_sorted = sorted(path.glob(path_pattern))
-    if pattern_files_sorted != []:
-        common_filename, last_file_index = pattern_files_sorted[-1].stem.split(sep)
-        new_file_index = int(last_file_index) + 1
+    last_file_index = 0
+    with contextlib.suppress(FileNotFoundError), os.scandir(path) as entries:
+        for entry in entries:
+            match = file_name_re.fullmatch(entry.name)
+            if match:
+                last_file_index = max(last_file_index, int(match.group(1)))
+    new_file_index = last_file_index + 1
 
-    return Path(f"{common_filename}{sep}{new_file_index}{loc_pattern.suffix}")
+    return Path(f"{common_filename}{sep}{new_file_index}{suffix}")
 
 
 def mkdir(new_path: Path, **kwargs):
@@ -70,5 +101,5 @@ def mkdir(new_path: Path, **kwargs):
         Additional options for `pathlib.Path.mkdir()`
 
     """
-    get_logger().debug(f"Creating {new_path} directory")
+    get_logger().debug("Creating %s directory", new_path)
     new_path.mkdir(**kwargs)
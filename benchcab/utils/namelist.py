@@ -4,6 +4,7 @@
 """Contains utility functions for manipulating Fortran namelist files."""
 
 from pathlib import Path
+from typing import Optional
 
 import f90nml
 
@@ -23,6 +24,29 @@ def patch_namelist(nml_path: Path, patch: dict):
     f90nml.write(deep_update(nml, patch), nml_path, force=True)
 
 
+def patch_namelist_batch(
+    nml_path: Path, patches: list[dict], patch_removes: Optional[list[dict]] = None
+) -> dict:
+    """Applies all namelist patches to `nml_path`, reading and writing the file once.
+
+    Patches in `patches` are applied in order as in `patch_namelist`, after
+    which the parameters specified by each dictionary in `patch_removes` are
+    removed as in `patch_remove_namelist`. Returns the resulting namelist.
+
+    All dictionaries must comply with the `f90nml` api.
+    """
+    nml = f90nml.read(nml_path) if nml_path.exists() else {}
+    nml = deep_update(nml, *patches)
+    for patch_remove in patch_removes or []:
+        try:
+            nml = deep_del(nml, patch_remove)
+        except KeyError as exc:
+            msg = f"Namelist parameters specified in `patch_remove` do not exist in {nml_path.name}."
+            raise KeyError(msg) from exc
+    f90nml.write(nml, nml_path, force=True)
+    return nml
+
+
 def patch_remove_namelist(nml_path: Path, patch_remove: dict):
     """Removes a subset of namelist parameters specified by `patch_remove` from `nml_path`.
 
@@ -5,7 +5,24 @@
 
 from typing import TypedDict
 
-from benchcab.utils import interpolate_file_template
+PBS_JOB_SCRIPT_TEMPLATE = """\
+#!/bin/bash
+#PBS -l wd
+#PBS -l ncpus={ncpus}
+#PBS -l mem={mem}
+#PBS -l walltime={walltime}
+#PBS -q normal
+#PBS -P {project}
+#PBS -j oe
+#PBS -m e
+#PBS -l storage={storage}
+
+module purge
+{module_load_lines}
+set -ev
+
+{benchcab_path} fluxsite-run-tasks --config={config_path}{verbose_flag}
+"""
 
 
 class PBSConfig(TypedDict):
@@ -34,8 +51,10 @@ def render_job_script(
     verbose_flag = " -v" if verbose else ""
     storage_flags = ["gdata/ks32", "gdata/hh5", "gdata/wd9", *pbs_config["storage"]]
 
-    context = dict(
-        modules=modules,
+    module_load_lines = "".join([f"module load {module}\n" for module in modules])
+
+    job_script = PBS_JOB_SCRIPT_TEMPLATE.format(
+        module_load_lines=module_load_lines,
         verbose_flag=verbose_flag,
         ncpus=pbs_config["ncpus"],
         mem=pbs_config["mem"],
@@ -44,7 +63,11 @@ def render_job_script(
         storage="+".join(storage_flags),
         benchcab_path=benchcab_path,
         config_path=config_path,
-        skip_bitwise_cmp=skip_bitwise_cmp,
     )
 
-    return interpolate_file_template("pbs_jobscript.j2", **context)
+    if not skip_bitwise_cmp:
+        job_script += (
+            f"{benchcab_path} fluxsite-bitwise-cmp --config={config_path}{verbose_flag}"
+        )
+
+    return job_script
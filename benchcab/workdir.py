@@ -5,6 +5,7 @@
 
 import shutil
 from pathlib import Path
+from typing import Iterable
 
 from benchcab import internal
 from benchcab.utils.fs import mkdir
@@ -28,17 +29,29 @@ def clean_submission_files():
         pbs_job_file.unlink()
 
 
+def _mkdir_leaves(paths: Iterable[Path]):
+    """Create the directories in `paths`, along with any missing parents.
+
+    Only directories that are not a parent of another directory in `paths`
+    are created explicitly as their parents are created along the way.
+    """
+    paths = set(paths)
+    parents = {parent for path in paths for parent in path.parents}
+    for path in sorted(paths - parents):
+        mkdir(path, parents=True, exist_ok=True)
+
+
 def setup_fluxsite_directory_tree():
     """Generate the directory structure used by `benchcab`."""
-    for path in internal.FLUXSITE_DIRS.values():
-        mkdir(path, parents=True, exist_ok=True)
+    _mkdir_leaves(internal.FLUXSITE_DIRS.values())
 
 
 def setup_spatial_directory_tree():
     """Generate the directory structure for running spatial tests."""
-    for path in [
-        internal.SPATIAL_RUN_DIR,
-        internal.SPATIAL_TASKS_DIR,
-        internal.PAYU_LABORATORY_DIR,
-    ]:
-        mkdir(path, parents=True, exist_ok=True)
+    _mkdir_leaves(
+        [
+            internal.SPATIAL_RUN_DIR,
+            internal.SPATIAL_TASKS_DIR,
+            internal.PAYU_LABORATORY_DIR,
+        ]
+    )
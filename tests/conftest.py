@@ -9,6 +9,7 @@ from typing import Optional
 
 import pytest
 
+from benchcab import internal
 from benchcab.environment_modules import EnvironmentModulesInterface
 from benchcab.utils.subprocess import SubprocessWrapperInterface
 
@@ -34,6 +35,22 @@ def _run_around_tests(mock_cwd):
     shutil.rmtree(mock_cwd)
 
 
+@pytest.fixture()
+def met_dir(monkeypatch, mock_cwd):
+    """Set MET_DIR to a directory with a met file for every site id.
+
+    The return value is the path of the directory.
+    """
+    _met_dir = mock_cwd / "met"
+    _met_dir.mkdir()
+    for site_id in internal.MEORG_EXPERIMENTS["forty-two-site-test"]:
+        (_met_dir / f"{site_id}_2000-2001_FLUXNET2015_Met.nc").touch()
+    monkeypatch.setattr(internal, "MET_DIR", _met_dir)
+    internal.get_met_dir_index.cache_clear()
+    yield _met_dir
+    internal.get_met_dir_index.cache_clear()
+
+
 @pytest.fixture()
 def config():
     """Returns a valid mock config."""
@@ -119,6 +136,7 @@ def mock_subprocess_handler():
             self.stdout = "mock standard output"
             self.error_on_call = False
             self.env = {}
+            self.cwd = None
 
         def run_cmd(
             self,
@@ -126,6 +144,7 @@ def mock_subprocess_handler():
             capture_output: bool = False,
             output_file: Optional[Path] = None,
             env: Optional[dict] = None,
+            cwd: Optional[Path] = None,
         ) -> CompletedProcess:
             self.commands.append(cmd)
             if self.error_on_call:
@@ -134,6 +153,8 @@ def mock_subprocess_handler():
                 output_file.touch()
             if env:
                 self.env = env
+            if cwd:
+                self.cwd = cwd
             return CompletedProcess(cmd, returncode=0, stdout=self.stdout)
 
     return MockSubprocessWrapper()
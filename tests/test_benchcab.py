@@ -1,11 +1,13 @@
 """`pytest` tests for `benchcab.py`."""
 
+import os
 import re
 from contextlib import nullcontext as does_not_raise
 from unittest import mock
 
 import pytest
 
+from benchcab import internal
 from benchcab.benchcab import Benchcab
 
 
@@ -66,3 +68,48 @@ def test_user_project_group(config_project, pytest_error):
     app = Benchcab(benchcab_exe_path=None)
     with pytest_error:
         app._validate_environment(project=config_project, modules=[])
+
+
+def test_system_paths_prepended_once(monkeypatch):
+    """Success case: system paths are only prepended to $PATH once."""
+    monkeypatch.setenv("PATH", "/foo/bin")
+    Benchcab(benchcab_exe_path=None)
+    Benchcab(benchcab_exe_path=None)
+    assert os.environ["PATH"] == "/bin:/usr/bin:/usr/local/bin:/foo/bin"
+
+
+class TestValidateEnvironment:
+    """Tests for `Benchcab._validate_environment()`."""
+
+    @pytest.fixture()
+    def app(self, mock_cwd, mock_environment_modules_handler):
+        """Return a `Benchcab` instance in a mock Gadi environment."""
+        (mock_cwd / internal.NAMELIST_DIR).mkdir()
+        _app = Benchcab(benchcab_exe_path=None)
+        _app.modules_handler = mock_environment_modules_handler
+        with mock.patch.object(
+            internal, "get_nodename", return_value="gadi-login-01.gadi.nci.org.au"
+        ), mock.patch(
+            "benchcab.benchcab._current_group_names",
+            return_value=frozenset(("hh5", "ks32")),
+        ):
+            yield _app
+
+    def test_valid_environment(self, app, met_dir):
+        """Success case: every site id maps to a single met file."""
+        with does_not_raise():
+            app._validate_environment(project="hh5", modules=[])
+
+    def test_missing_met_file(self, app, met_dir):
+        """Failure case: a site id does not map to a met file."""
+        (met_dir / "AU-Tum_2000-2001_FLUXNET2015_Met.nc").unlink()
+        internal.get_met_dir_index.cache_clear()
+        with pytest.raises(SystemExit):
+            app._validate_environment(project="hh5", modules=[])
+
+    def test_multiple_met_files(self, app, met_dir):
+        """Failure case: a site id maps to multiple met files."""
+        (met_dir / "AU-Tum_2002-2017_OzFlux_Met.nc").touch()
+        internal.get_met_dir_index.cache_clear()
+        with pytest.raises(SystemExit):
+            app._validate_environment(project="hh5", modules=[])
@@ -8,6 +8,7 @@ from unittest import mock
 
 import pytest
 
+import benchcab
 import benchcab.config as bc
 import benchcab.internal as bi
 import benchcab.utils as bu
@@ -26,6 +27,14 @@ def _set_project_env_variable(monkeypatch):
         yield
 
 
+# Redirect the config cache so that tests do not read from or write to $HOME
+@pytest.fixture(autouse=True)
+def config_cache_dir(_set_project_env_variable, monkeypatch, tmp_path) -> Path:
+    """Set $XDG_CACHE_HOME and return the directory used to cache configs."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache" / internal.CONFIG_CACHE_DIR
+
+
 @pytest.fixture()
 def config_str(request) -> str:
     """Provide relative YAML path string of data files."""
@@ -184,6 +193,13 @@ class TestReadOptionalKey:
         bc.read_optional_key(config)
         assert pformat(config) == pformat(request.getfixturevalue(output_config))
 
+    def test_custom_met_forcings_replace_defaults(self, no_optional_config):
+        """User specified spatial met forcings are not merged with the defaults."""
+        met_forcings = {"foo": "https://github.com/CABLE-LSM/foo.git"}
+        config = no_optional_config | {"spatial": {"met_forcings": met_forcings}}
+        bc.read_optional_key(config)
+        assert config["spatial"]["met_forcings"] == met_forcings
+
     def test_no_project_name(
         self, no_optional_config, all_optional_default_config_no_project, monkeypatch
     ):
@@ -207,3 +223,82 @@ def test_read_config(config_path, output_config, request):
     """Test overall behaviour of read_config."""
     config = bc.read_config(config_path)
     assert pformat(config) == pformat(request.getfixturevalue(output_config))
+
+
+@pytest.mark.parametrize("config_str", ["config-basic.yml"], indirect=True)
+def test_read_config_cache(config_path, all_optional_default_config, config_cache_dir):
+    """Test read_config reuses the cached config on subsequent reads."""
+    config = bc.read_config(config_path)
+    assert len(list(config_cache_dir.glob("config-*"))) == 1
+    with mock.patch.object(bc, "read_config_file") as mocked_read_config_file:
+        assert bc.read_config(config_path) == config
+        mocked_read_config_file.assert_not_called()
+    assert pformat(config) == pformat(all_optional_default_config)
+
+
+@pytest.mark.parametrize("config_str", ["config-basic.yml"], indirect=True)
+def test_read_config_cache_invalidated_on_upgrade(config_path, monkeypatch):
+    """Test the cached config is invalidated when benchcab or its schema change."""
+    bc.read_config(config_path)
+    cache_path = bc._config_cache_path(config_path)
+    monkeypatch.setattr(benchcab, "__version__", "0.0.0-test", raising=False)
+    assert bc._config_cache_path(config_path) != cache_path
+    cache_path = bc._config_cache_path(config_path)
+    monkeypatch.setattr(bc, "_get_schema_digest", lambda: "changed")
+    assert bc._config_cache_path(config_path) != cache_path
+    with mock.patch.object(
+        bc, "read_config_file", wraps=bc.read_config_file
+    ) as mocked_read_config_file:
+        bc.read_config(config_path)
+        mocked_read_config_file.assert_called_once()
+
+
+@pytest.mark.parametrize("config_str", ["config-basic.yml"], indirect=True)
+def test_read_config_cache_removes_stale_entries(
+    config_path, monkeypatch, config_cache_dir
+):
+    """Test writing a new cache entry removes stale entries for the same file."""
+    bc.read_config(config_path)
+    monkeypatch.setattr(bc, "_get_schema_digest", lambda: "changed")
+    bc.read_config(config_path)
+    assert list(config_cache_dir.glob("config-*")) == [
+        bc._config_cache_path(config_path)
+    ]
+
+
+@pytest.mark.parametrize("config_str", ["config-basic.yml"], indirect=True)
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"",
+        b"not a pickle",
+        b"\x80\x09.",
+        b"cbuiltins\nmissing\n.",
+        b"cno_such_module\nmissing\n.",
+    ],
+)
+def test_read_config_corrupt_cache(config_path, all_optional_default_config, contents):
+    """Test read_config falls back to the config file if the cache is unreadable."""
+    cache_path = bc._config_cache_path(config_path)
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_bytes(contents)
+    config = bc.read_config(config_path)
+    assert pformat(config) == pformat(all_optional_default_config)
+    assert bc.read_config(config_path) == config
+
+
+@pytest.mark.parametrize("config_str", ["config-basic.yml"], indirect=True)
+def test_config_cache_dir(config_path, monkeypatch, tmp_path):
+    """Test the cache follows $XDG_CACHE_HOME and falls back to ~/.cache."""
+    assert bc._config_cache_path(config_path).parent == (
+        tmp_path / "cache" / "benchcab"
+    )
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CACHE_HOME", "relative/cache")
+    assert bc._config_cache_path(config_path).parent == (
+        tmp_path / "home" / ".cache" / "benchcab"
+    )
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    assert bc._config_cache_path(config_path).parent == (
+        tmp_path / "home" / ".cache" / "benchcab"
+    )
@@ -5,12 +5,15 @@ the working directory used for testing is cleaned up in the `_run_around_tests`
 pytest autouse fixture.
 """
 
+import errno
 import logging
+import os
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
-from benchcab.utils.fs import chdir, mkdir, next_path
+from benchcab.utils.fs import chdir, link_or_copy, mkdir, next_path
 
 
 class TestNextPath:
@@ -30,6 +33,17 @@ class TestNextPath:
         next_path(pattern).touch()
         assert next_path(pattern) == Path("rev_number-2.log")
 
+    def test_next_path_compares_indices_numerically(self, pattern):
+        """Success case: get next path when indices have a different number of digits."""
+        Path("rev_number-9.log").touch()
+        Path("rev_number-10.log").touch()
+        assert next_path(pattern) == Path("rev_number-11.log")
+
+    def test_next_path_with_separator_in_file_name(self):
+        """Success case: get next path when the common file name contains the separator."""
+        Path("rev-number-1.log").touch()
+        assert next_path("rev-number-*.log") == Path("rev-number-2.log")
+
 
 class TestChdir:
     """Tests for `chdir()`."""
@@ -68,3 +82,58 @@ class TestMkdir:
         mkdir(test_path, **kwargs)
         assert test_path.exists()
         test_path.rmdir()
+
+
+class TestLinkOrCopy:
+    """Tests for `link_or_copy()`."""
+
+    @pytest.fixture()
+    def src(self):
+        """Create and return a source file."""
+        _src = Path("src.txt")
+        _src.write_text("foo")
+        return _src
+
+    def test_file_is_hard_linked(self, src):
+        """Success case: destination is a hard link to the source file."""
+        dest = Path("dest.txt")
+        link_or_copy(src, dest)
+        assert dest.samefile(src)
+
+    def test_existing_file_is_replaced(self, src):
+        """Success case: an existing destination is replaced by a hard link."""
+        dest = Path("dest.txt")
+        dest.write_text("bar")
+        link_or_copy(src, dest)
+        assert dest.samefile(src)
+        assert dest.read_text() == "foo"
+
+    def test_existing_hard_link_is_not_written_through(self, src):
+        """Success case: a destination linked to another file is not written through."""
+        other = Path("other.txt")
+        other.write_text("bar")
+        dest = Path("dest.txt")
+        os.link(other, dest)
+        link_or_copy(src, dest)
+        assert dest.samefile(src)
+        assert other.read_text() == "bar"
+
+    def test_destination_already_linked_to_source(self, src):
+        """Success case: linking again to the same destination succeeds."""
+        dest = Path("dest.txt")
+        link_or_copy(src, dest)
+        link_or_copy(src, dest)
+        assert dest.samefile(src)
+
+    def test_copy_across_file_systems(self, src):
+        """Success case: fall back to copying when linking across file systems."""
+        dest = Path("dest.txt")
+        with mock.patch("os.link", side_effect=OSError(errno.EXDEV, "")):
+            link_or_copy(src, dest)
+        assert not dest.samefile(src)
+        assert dest.read_text() == "foo"
+
+    def test_other_link_errors_are_raised(self, src):
+        """Failure case: link errors other than EXDEV or EPERM are raised."""
+        with pytest.raises(FileNotFoundError):
+            link_or_copy(src, Path("missing") / "dest.txt")
@@ -0,0 +1,57 @@
+"""`pytest` tests for `internal.py`."""
+
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from benchcab import internal
+
+
+class TestGetMetForcingFileNames:
+    """Tests for `get_met_forcing_file_names()`."""
+
+    def test_single_site(self, met_dir):
+        """Success case: get the met file for a five-site-test site id."""
+        assert internal.get_met_forcing_file_names("AU-Tum") == [
+            "AU-Tum_2000-2001_FLUXNET2015_Met.nc"
+        ]
+
+    def test_experiment(self, met_dir):
+        """Success case: get the met files for an experiment in site id order."""
+        assert internal.get_met_forcing_file_names("forty-two-site-test") == [
+            f"{site_id}_2000-2001_FLUXNET2015_Met.nc"
+            for site_id in internal.MEORG_EXPERIMENTS["forty-two-site-test"]
+        ]
+
+    def test_site_id_matched_as_prefix(self, met_dir):
+        """Success case: met files are matched by prefix, as with `glob`."""
+        (met_dir / "AU-Tum_2000-2001_FLUXNET2015_Met.nc").unlink()
+        (met_dir / "AU-TumbaMet.nc").touch()
+        internal.get_met_dir_index.cache_clear()
+        assert internal.get_met_forcing_file_names("AU-Tum") == ["AU-TumbaMet.nc"]
+        assert internal.get_met_file_names("AU-Tum") == sorted(
+            path.name for path in met_dir.glob("AU-Tum*")
+        )
+
+    @pytest.mark.parametrize("missing", ["site", "met_dir"])
+    def test_missing_met_file(self, met_dir, monkeypatch, missing):
+        """Failure case: raise an error naming the site id and MET_DIR."""
+        if missing == "site":
+            (met_dir / "AU-Tum_2000-2001_FLUXNET2015_Met.nc").unlink()
+        else:
+            monkeypatch.setattr(internal, "MET_DIR", met_dir / "missing")
+        internal.get_met_dir_index.cache_clear()
+        with pytest.raises(
+            FileNotFoundError,
+            match=f"Failed to infer met file for site id 'AU-Tum' in {internal.MET_DIR}",
+        ):
+            internal.get_met_forcing_file_names("AU-Tum")
+
+    def test_missing_met_dir_is_not_cached(self, met_dir, monkeypatch):
+        """Success case: MET_DIR is rescanned if it did not exist."""
+        monkeypatch.setattr(internal, "MET_DIR", met_dir.parent / "later")
+        internal.get_met_dir_index.cache_clear()
+        assert internal.get_met_file_names("AU-Tum") == []
+        met_dir.rename(internal.MET_DIR)
+        with does_not_raise():
+            internal.get_met_forcing_file_names("AU-Tum")
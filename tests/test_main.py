@@ -0,0 +1,19 @@
+"""`pytest` tests for `main.py`."""
+
+import pytest
+
+from benchcab.main import _LazyBenchcab
+
+
+def test_private_attributes_are_not_dispatched():
+    """Failure case: private attribute lookups raise an AttributeError."""
+    app = _LazyBenchcab(benchcab_exe_path=None)
+    with pytest.raises(AttributeError, match="_some_method"):
+        app._some_method
+
+
+def test_public_attributes_are_dispatched():
+    """Success case: public attribute lookups return a dispatch function."""
+    app = _LazyBenchcab(benchcab_exe_path=None)
+    assert callable(app.fluxsite)
+    assert app._app is None
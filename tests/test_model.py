@@ -11,7 +11,7 @@ from pathlib import Path
 import pytest
 
 from benchcab import internal
-from benchcab.model import Model, remove_module_lines
+from benchcab.model import Model, calls_module, find_offline_source_files
 from benchcab.utils.repo import Repo
 
 
@@ -299,7 +299,28 @@ class TestCustomBuild:
         """Success case: execute the build command for a custom build script."""
         model.build_script = str(build_script)
         model.custom_build(modules)
-        assert "./tmp-build.sh" in mock_subprocess_handler.commands
+        assert "bash ./tmp-build.sh" in mock_subprocess_handler.commands
+
+    def test_build_script_is_run_without_module_lines(
+        self, model, build_script, modules
+    ):
+        """Success case: the build script is run without module lines."""
+        build_script_path = internal.SRC_DIR / model.name / build_script
+        build_script_path.write_text("module load foo\n./build.ksh\n")
+        model.build_script = str(build_script)
+        model.custom_build(modules)
+        tmp_script_path = build_script_path.parent / "tmp-build.sh"
+        assert tmp_script_path.read_text() == "./build.ksh\n"
+
+    def test_build_script_is_run_with_shebang_interpreter(
+        self, model, mock_subprocess_handler, build_script, modules
+    ):
+        """Success case: the build script is run with the interpreter in its shebang."""
+        build_script_path = internal.SRC_DIR / model.name / build_script
+        build_script_path.write_text("#!/bin/ksh -e\nmodule purge\nmake\n")
+        model.build_script = str(build_script)
+        model.custom_build(modules)
+        assert "/bin/ksh -e ./tmp-build.sh" in mock_subprocess_handler.commands
 
     def test_modules_loaded_at_runtime(
         self, model, mock_environment_modules_handler, build_script, modules
@@ -328,8 +349,47 @@ class TestCustomBuild:
             model.custom_build(modules)
 
 
-class TestRemoveModuleLines:
-    """Tests for `remove_module_lines()`."""
+class TestFindOfflineSourceFiles:
+    """Tests for `find_offline_source_files()`."""
+
+    def test_matches_glob(self, mock_cwd):
+        """Success case: find the same files as globbing `OFFLINE_SOURCE_FILES`."""
+        src_dir = mock_cwd / "src"
+        for file_name in [
+            "science/albedo/cable_albedo.F90",
+            "science/albedo/.h.F90",
+            "science/albedo/notes.txt",
+            "offline/cable_driver.F90",
+            "offline/subdir.F90/file.F90",
+            "util/cable_common.f90",
+        ]:
+            (src_dir / file_name).parent.mkdir(parents=True, exist_ok=True)
+            (src_dir / file_name).touch()
+        assert set(find_offline_source_files(src_dir)) == {
+            path
+            for pattern in internal.OFFLINE_SOURCE_FILES
+            for path in src_dir.glob(pattern)
+            if path.is_file()
+        }
+
+
+class TestCallsModule:
+    """Tests for `calls_module()`."""
+
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            ('echo "#"; module load foo\n', True),
+            ("echo '#' module load foo\n", True),
+            ('echo "module"\n', True),
+            ('echo "module load foo"\n', False),
+            ('echo foo # "module" load\n', False),
+            ("echo mod\\ule\n", True),
+        ],
+    )
+    def test_quoted_lines_match_shlex(self, line, expected):
+        """Success case: lines with quotes or escapes are handled as by `shlex`."""
+        assert calls_module(line) is expected
 
     def test_module_lines_removed_from_shell_script(self):
         """Success case: test 'module' lines are removed from mock shell script."""
@@ -359,11 +419,11 @@ host_gadi()
 """
             )
 
-        remove_module_lines(file_path)
-
         with file_path.open("r", encoding="utf-8") as file:
-            assert file.read() == (
-                """#!/bin/bash
+            lines = [line for line in file if not calls_module(line)]
+
+        assert "".join(lines) == (
+            """#!/bin/bash
 
 host_gadi()
 {
@@ -376,4 +436,4 @@ host_gadi()
    fi
 }
 """
-            )
+        )
@@ -5,7 +5,11 @@ from pathlib import Path
 import f90nml
 import pytest
 
-from benchcab.utils.namelist import patch_namelist, patch_remove_namelist
+from benchcab.utils.namelist import (
+    patch_namelist,
+    patch_namelist_batch,
+    patch_remove_namelist,
+)
 
 
 class TestPatchNamelist:
@@ -85,3 +89,39 @@ class TestPatchRemoveNamelist:
             match=f"Namelist parameters specified in `patch_remove` do not exist in {nml_path.name}.",
         ):
             patch_remove_namelist(nml_path, {"cable": {"foo": {"bar": True}}})
+
+
+class TestPatchNamelistBatch:
+    """Tests for `patch_namelist_batch()`."""
+
+    @pytest.fixture()
+    def nml_path(self):
+        """Create a namelist file and return its path."""
+        _nml_path = Path("test.nml")
+        f90nml.write({"cable": {"file": "/path/to/file", "bar": 123}}, _nml_path)
+        return _nml_path
+
+    def test_patches_applied_in_order(self, nml_path):
+        """Success case: later patches take precedence over earlier patches."""
+        patch_namelist_batch(
+            nml_path,
+            [{"cable": {"bar": 456, "baz": True}}, {"cable": {"bar": 789}}],
+        )
+        assert f90nml.read(nml_path) == {
+            "cable": {"file": "/path/to/file", "bar": 789, "baz": True}
+        }
+
+    def test_patch_removes_applied_after_patches(self, nml_path):
+        """Success case: parameters are removed after all patches are applied."""
+        nml = patch_namelist_batch(
+            nml_path,
+            [{"cable": {"baz": True}}],
+            [{"cable": {"bar": 123}}, {"cable": {"baz": True}}],
+        )
+        assert f90nml.read(nml_path) == {"cable": {"file": "/path/to/file"}}
+        assert nml == {"cable": {"file": "/path/to/file"}}
+
+    def test_patch_remove_of_missing_parameter_raises(self, nml_path):
+        """Failure case: removing a parameter that does not exist raises a KeyError."""
+        with pytest.raises(KeyError, match="do not exist in test.nml"):
+            patch_namelist_batch(nml_path, [], [{"cable": {"missing": True}}])
@@ -6,9 +6,11 @@ pytest autouse fixture.
 """
 
 import contextlib
+import copy
 import io
 import logging
 from pathlib import Path
+from subprocess import CalledProcessError
 
 import f90nml
 import pytest
@@ -16,7 +18,7 @@ import yaml
 
 from benchcab import internal
 from benchcab.model import Model
-from benchcab.spatial import SpatialTask, get_spatial_tasks
+from benchcab.spatial import SpatialTask, get_spatial_tasks, run_tasks
 from benchcab.utils import get_logger
 from benchcab.utils.repo import Repo
 
@@ -74,6 +76,29 @@ class TestGetTaskName:
         assert task.get_task_name() == "crujra_access_R1_S0"
 
 
+class TestCloneExperiment:
+    """Tests for `SpatialTask.clone_experiment()`."""
+
+    def test_git_clone_command(self, task, mock_subprocess_handler):
+        """Success case: test shallow git clone command."""
+        task.clone_experiment()
+        assert (
+            "git clone --depth=1 --single-branch -- "
+            "https://github.com/CABLE-LSM/cable_example.git "
+            f"{internal.SPATIAL_TASKS_DIR / task.get_task_name()}"
+        ) in mock_subprocess_handler.commands
+
+    def test_git_clone_arguments_are_quoted(self, task, mock_subprocess_handler):
+        """Success case: quote the experiment URL and task directory for the shell."""
+        task.met_forcing_payu_experiment = "https://example.com/a repo.git; rm -rf ~"
+        task.clone_experiment()
+        assert (
+            "git clone --depth=1 --single-branch -- "
+            "'https://example.com/a repo.git; rm -rf ~' "
+            f"{internal.SPATIAL_TASKS_DIR / task.get_task_name()}"
+        ) in mock_subprocess_handler.commands
+
+
 class TestConfigureExperiment:
     """Tests for `SpatialTask.configure_experiment()`."""
 
@@ -171,6 +196,9 @@ class TestRun:
         """Success case: test payu run command."""
         task.run()
         assert "payu run" in mock_subprocess_handler.commands
+        assert mock_subprocess_handler.cwd == (
+            internal.SPATIAL_TASKS_DIR / task.get_task_name()
+        )
 
     def test_payu_run_with_optional_arguments(self, task, mock_subprocess_handler):
         """Success case: test payu run command with optional arguments."""
@@ -179,6 +207,31 @@ class TestRun:
         assert "payu run --some-flag" in mock_subprocess_handler.commands
 
 
+class TestRunTasks:
+    """Tests for `run_tasks()`."""
+
+    @pytest.fixture()
+    def tasks(self, task):
+        """Return a list of tasks with distinct payu arguments."""
+        _tasks = [copy.copy(task) for _ in range(10)]
+        for i, _task in enumerate(_tasks):
+            _task.payu_args = f"--task {i}"
+        return _tasks
+
+    def test_all_tasks_are_run(self, tasks, mock_subprocess_handler):
+        """Success case: every task is run exactly once."""
+        run_tasks(tasks, max_workers=4)
+        assert sorted(mock_subprocess_handler.commands) == sorted(
+            f"payu run --task {i}" for i in range(len(tasks))
+        )
+
+    def test_task_exception_is_raised(self, tasks, mock_subprocess_handler):
+        """Failure case: an exception raised by a task is re-raised."""
+        mock_subprocess_handler.error_on_call = True
+        with pytest.raises(CalledProcessError):
+            run_tasks(tasks, max_workers=4)
+
+
 class TestGetSpatialTasks:
     """Tests for `get_spatial_tasks()`."""
 
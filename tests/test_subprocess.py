@@ -135,6 +135,11 @@ class TestRunCmd:
         )
         assert proc.stdout == "bar\n"
 
+    def test_command_is_run_in_working_directory(self, subprocess_handler, tmp_path):
+        """Success case: test command is run in the given working directory."""
+        proc = subprocess_handler.run_cmd("pwd", capture_output=True, cwd=tmp_path)
+        assert proc.stdout == f"{tmp_path}\n"
+
     def test_check_non_zero_return_code_throws_an_exception(self, subprocess_handler):
         """Failure case: check non-zero return code throws an exception."""
         with pytest.raises(subprocess.CalledProcessError):
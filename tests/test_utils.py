@@ -22,6 +22,13 @@ def test_load_package_data_fail():
         _ = bu.load_package_data("config-missing.yml")
 
 
+def test_load_package_data_returns_copy():
+    """Test load_package_data() returns a fresh copy of cached dictionaries."""
+    data = bu.load_package_data("config-schema.yml")
+    data.clear()
+    assert bu.load_package_data("config-schema.yml")
+
+
 def test_interpolate_string_template_pass():
     """Test interpolate_string_template() passes as expected."""
     result = bu.interpolate_string_template("I should {{status}}", status="pass")